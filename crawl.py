@@ -5,6 +5,7 @@ Main entry point for running crawls.
 """
 
 import argparse
+import signal
 import sys
 import os
 
@@ -85,6 +86,37 @@ Examples:
         default=3.0,
         help='Rate limit in seconds between requests (default: 3.0)'
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of requests in flight at once (default: 8)'
+    )
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=None,
+        help='Number of processes used for HTML parsing (default: CPU count)'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=86400,
+        help='Reuse pages fetched less than this many seconds ago without a request; 0 disables (default: 86400)'
+    )
+    parser.add_argument(
+        '--prefetch-pages',
+        type=int,
+        default=0,
+        help='Numbered listing/gallery pages fetched ahead of need; only helps with a low --rate-limit (default: 0, off)'
+    )
+    parser.add_argument(
+        '--make-traversal-threshold',
+        type=int,
+        default=None,
+        help='Skip the make pages of listing pages that link at least this many models directly; '
+             'models linked only from make pages are then missed (default: off)'
+    )
     
     args = parser.parse_args()
     
@@ -110,12 +142,20 @@ Examples:
             output_dir=args.output,
             checkpoint_dir=args.checkpoint_dir,
             log_dir=args.log_dir,
-            rate_limit=args.rate_limit
+            rate_limit=args.rate_limit,
+            concurrency=args.concurrency,
+            parse_workers=args.parse_workers,
+            cache_ttl=args.cache_ttl,
+            prefetch_pages=args.prefetch_pages,
+            make_traversal_threshold=args.make_traversal_threshold
         )
     except Exception as e:
         print(f"❌ Failed to initialize crawler: {e}", file=sys.stderr)
         sys.exit(1)
     
+    # Exit normally on SIGTERM so the checkpoint delta is merged at exit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(143))
+    
     # Run crawl based on mode
     try:
         if args.resume:
@@ -2,15 +2,70 @@
 Checkpointing system for resume capability.
 """
 
-import json
+import atexit
+import gzip
+import hashlib
 import os
-from typing import Dict, Set, Optional
+import sys
+import threading
+import time
+import zlib
+from array import array
+from contextlib import contextmanager
+from itertools import compress
+from typing import Dict, List, Set, Optional, Tuple
 from datetime import datetime
 
+try:
+    from . import fastjson
+    from .timestamps import format_timestamp
+except ImportError:  # run directly as a script
+    import fastjson
+    from timestamps import format_timestamp
+
+
+def _parse_timestamp(value) -> float:
+    """Convert a stored ISO timestamp to seconds since the epoch (0.0 if missing)."""
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Status codes stored per URL in Checkpoint.status
+STATUS_DISCOVERED = 0
+STATUS_PARSED = 1
+STATUS_SAVED = 2
+STATUS_FAILED = 3
+STATUS_NONE = 255  # context stored but no state transition yet
+
+STATUS_NAMES = ('discovered', 'parsed', 'saved', 'failed')
+_STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+# bytes.translate table turning status codes into 1 (incomplete) / 0 (saved)
+_INCOMPLETE_MASK = bytes(0 if code == STATUS_SAVED else 1 for code in range(256))
+
 
 class Checkpoint:
     """Manages checkpoint state for crawler resume capability."""
     
+    # Rewrite completed_urls.txt sorted and deduplicated after this many appends
+    COMPACT_EVERY = 1000
+    
+    # Merge the delta log into the base snapshot after this many delta records
+    MERGE_EVERY = 1000
+    
+    # Rewrite http_cache.log with one line per URL once this many of its lines
+    # have been superseded by later entries
+    HTTP_CACHE_COMPACT_EVERY = 1000
+    
+    # Outside batch(), changes are written to the delta log once this many URLs
+    # are dirty or FLUSH_INTERVAL seconds after the last write, whichever is first
+    FLUSH_EVERY = 50
+    FLUSH_INTERVAL = 5.0
+    
     def __init__(self, checkpoint_dir: str = "checkpoints"):
         """
         Initialize checkpoint system.
@@ -19,56 +74,490 @@ class Checkpoint:
             checkpoint_dir: Directory to store checkpoint files
         """
         self.checkpoint_dir = checkpoint_dir
-        self.checkpoint_file = os.path.join(checkpoint_dir, "checkpoint.json")
+        self.checkpoint_file = os.path.join(checkpoint_dir, "checkpoint.json.gz")
+        self.legacy_checkpoint_file = os.path.join(checkpoint_dir, "checkpoint.json")
+        self.checkpoint_log_file = os.path.join(checkpoint_dir, "checkpoint.log")
         self.completed_urls_file = os.path.join(checkpoint_dir, "completed_urls.txt")
+        self.http_cache_file = os.path.join(checkpoint_dir, "http_cache.log")
+        self.bodies_dir = os.path.join(checkpoint_dir, "bodies")
         
         # Ensure checkpoint directory exists
         os.makedirs(checkpoint_dir, exist_ok=True)
         
+        # Per-URL state is kept as parallel columns indexed by url_idx[url]
+        # rather than one dict per URL; errors and contexts are sparse
+        self._init_state()
+        
         # Load existing checkpoint
-        self.checkpoint_data = self._load_checkpoint()
-        self.completed_urls = self._load_completed_urls()
+        self._log_lines = 0
+        self._load_checkpoint()
+        # Share the URL objects already held by the state columns
+        url_idx, urls = self.url_idx, self.urls
+        self.completed_urls = {
+            urls[url_idx[url]] if url in url_idx else url
+            for url in self._load_completed_urls()
+        }
+        
+        # URL indexes changed since the last save; only these are written to the delta log
+        self._dirty: Set[int] = set()
+        # completed_urls.txt is written as soon as a URL is saved, but its status
+        # change may still have been waiting for a delta log write when the
+        # process died; a completed URL is saved
+        for url in self.completed_urls:
+            idx = url_idx.get(url)
+            if idx is not None and self.status[idx] != STATUS_SAVED:
+                self.status[idx] = STATUS_SAVED
+                self.errors.pop(idx, None)
+                self._dirty.add(idx)
+        # Inside batch() saves are deferred until the outermost batch exits
+        self._batch_depth = 0
+        self._sync_pending = False
+        self._last_flush = 0.0
+        # Models are processed on several threads; state changes and the
+        # writes they trigger happen under this (reentrant) lock
+        self._lock = threading.RLock()
+        
+        # State transitions and completed URLs are appended to open logs
+        # instead of rewriting whole files
+        self._log_fp = None
+        self._completed_fp = None
+        self._appends_since_compact = 0
+        
+        # ETag/Last-Modified validators and fetch time of fetched pages, with
+        # the page body stored gzip-compressed under bodies/ for reuse on 304
+        # responses and while the page is still fresh
+        self.http_cache = self._load_http_cache()
+        self._http_cache_fp = None
+        self._http_cache_lock = threading.Lock()
+        atexit.register(self.close)
     
-    def _load_checkpoint(self) -> Dict[str, Dict]:
-        """Load checkpoint JSON file."""
+    def _init_state(self):
+        """Create empty per-URL state columns."""
+        self.urls: List[str] = []
+        self.url_idx: Dict[str, int] = {}
+        self.status = array('B')
+        self.timestamps = array('d')
+        self.errors: Dict[int, str] = {}
+        self.contexts: Dict[int, Tuple[str, str]] = {}
+        # One shared tuple per distinct (category, subcategory) pair
+        self._context_pool: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    
+    def _index(self, url: str) -> int:
+        """Get the row index of a URL, adding an empty row if it is new."""
+        idx = self.url_idx.get(url)
+        if idx is None:
+            idx = len(self.urls)
+            self.urls.append(url)
+            self.url_idx[url] = idx
+            self.status.append(STATUS_NONE)
+            self.timestamps.append(0.0)
+        return idx
+    
+    def _shared_context(self, category: Optional[str], subcategory: Optional[str]) -> Tuple[str, str]:
+        """Return the shared tuple for a context so each pair is stored once."""
+        context = (category, subcategory)
+        return self._context_pool.setdefault(context, context)
+    
+    def _set_record(self, url: str, record: Dict):
+        """Replace the state of a URL with a stored record."""
+        idx = self._index(url)
+        self.status[idx] = _STATUS_CODES.get(record.get('status'), STATUS_NONE)
+        self.timestamps[idx] = _parse_timestamp(record.get('timestamp'))
+        if 'error' in record:
+            self.errors[idx] = sys.intern(record['error'])
+        else:
+            self.errors.pop(idx, None)
+        if 'category' in record or 'subcategory' in record:
+            self.contexts[idx] = self._shared_context(record.get('category'), record.get('subcategory'))
+        else:
+            self.contexts.pop(idx, None)
+    
+    def _record(self, idx: int) -> Dict:
+        """Build the stored record (as written to disk) of the URL at idx."""
+        record = {}
+        code = self.status[idx]
+        if code != STATUS_NONE:
+            record['status'] = STATUS_NAMES[code]
+        if self.timestamps[idx]:
+            record['timestamp'] = format_timestamp(self.timestamps[idx])
+        if idx in self.errors:
+            record['error'] = self.errors[idx]
+        if idx in self.contexts:
+            record['category'], record['subcategory'] = self.contexts[idx]
+        return record
+    
+    def _load_checkpoint(self):
+        """
+        Load checkpoint state from the base snapshot and the delta log.
+        
+        checkpoint.json.gz holds every record as of the last merge. Each line
+        of checkpoint.log holds the full record of one URL changed since then,
+        so later lines overwrite earlier ones. An uncompressed checkpoint.json
+        from older versions is read if there is no compressed snapshot yet.
+        """
         if os.path.exists(self.checkpoint_file):
+            snapshot_file, opener = self.checkpoint_file, gzip.open
+        else:
+            snapshot_file, opener = self.legacy_checkpoint_file, open
+        if os.path.exists(snapshot_file):
             try:
-                with open(self.checkpoint_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
+                with opener(snapshot_file, 'rb') as f:
+                    data = fastjson.loads(f.read())
+                for url, record in data.items():
+                    self._set_record(url, record)
+            except (fastjson.JSONDecodeError, IOError, EOFError):
+                self._init_state()
+        
+        if os.path.exists(self.checkpoint_log_file):
+            try:
+                with open(self.checkpoint_log_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            event = fastjson.loads(line)
+                        except fastjson.JSONDecodeError:
+                            # A crash can leave a partially written last line
+                            continue
+                        self._set_record(event['u'], event['d'])
+                        self._log_lines += 1
+            except IOError:
+                pass
     
     def _load_completed_urls(self) -> Set[str]:
         """Load completed URLs from text file."""
         completed = set()
         if os.path.exists(self.completed_urls_file):
             try:
-                with open(self.completed_urls_file, 'r') as f:
+                # One read and a C-level split instead of per-line iteration
+                with open(self.completed_urls_file, 'rb') as f:
+                    completed = set(f.read().decode('utf-8').splitlines())
+                completed.discard('')
+            except (IOError, UnicodeDecodeError):
+                pass
+        return completed
+    
+    def _load_http_cache(self) -> Dict[str, Dict]:
+        """Load HTTP validators from the append-only cache log (last line per URL wins)."""
+        cache = {}
+        self._http_cache_lines = 0
+        if os.path.exists(self.http_cache_file):
+            try:
+                with open(self.http_cache_file, 'rb') as f:
                     for line in f:
-                        url = line.strip()
-                        if url:
-                            completed.add(url)
+                        self._http_cache_lines += 1
+                        try:
+                            entry = fastjson.loads(line)
+                        except fastjson.JSONDecodeError:
+                            continue
+                        url = entry.pop('u')
+                        if entry:
+                            cache[url] = entry
+                        else:
+                            # An empty entry records that the URL was dropped
+                            cache.pop(url, None)
             except IOError:
                 pass
-        return completed
+        return cache
+    
+    def _body_path(self, url: str) -> str:
+        """Path of the cached body for a URL."""
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.bodies_dir, f"{name}.html.gz")
+    
+    def get_conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Get conditional request headers for a previously fetched URL.
+        
+        Args:
+            url: URL about to be fetched
+            
+        Returns:
+            If-None-Match/If-Modified-Since headers, or an empty dict if the
+            URL has no cached body
+        """
+        entry = self.http_cache.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def load_cached_body(self, url: str) -> Optional[str]:
+        """
+        Load the cached body of a URL.
+        
+        A body that cannot be read back (truncated or corrupt gzip data, bad
+        UTF-8) is dropped together with its cache entry, so the next fetch of
+        the URL is an unconditional GET instead of failing the same way again.
+        
+        Args:
+            url: Previously fetched URL
+        
+        Returns:
+            Cached body, or None if it is missing or unreadable
+        """
+        path = self._body_path(url)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (IOError, EOFError, zlib.error, UnicodeDecodeError):
+            self.drop_response(url)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+    
+    def drop_response(self, url: str):
+        """Forget the cached copy of a URL so it is fetched without validators."""
+        if url not in self.http_cache:
+            return
+        try:
+            self._append_http_cache_entry(url, {})
+        except IOError as e:
+            print(f"Error caching response: {e}")
+    
+    def load_fresh_body(self, url: str, max_age: float) -> Optional[str]:
+        """
+        Load the cached body of a URL if it was fetched recently enough.
+        
+        Args:
+            url: URL about to be fetched
+            max_age: Maximum age of the cached page in seconds
+            
+        Returns:
+            Cached body, or None if the URL is not cached or the copy is stale
+        """
+        entry = self.http_cache.get(url)
+        if not entry or time.time() - entry.get('fetched_at', 0) > max_age:
+            return None
+        return self.load_cached_body(url)
+    
+    def _append_http_cache_entry(self, url: str, entry: Dict):
+        """Record the cache entry of a URL (empty to drop it) in memory and in the cache log."""
+        with self._http_cache_lock:
+            if self._http_cache_fp is None:
+                self._http_cache_fp = open(self.http_cache_file, 'ab')
+            self._http_cache_fp.write(fastjson.dumps({'u': url, **entry}) + b'\n')
+            self._http_cache_fp.flush()
+            self._http_cache_lines += 1
+            if entry:
+                self.http_cache[url] = entry
+            else:
+                self.http_cache.pop(url, None)
+            if self._http_cache_lines - len(self.http_cache) >= self.HTTP_CACHE_COMPACT_EVERY:
+                self._compact_http_cache()
+    
+    def _compact_http_cache(self):
+        """Rewrite the cache log with only the latest entry per URL (caller holds _http_cache_lock)."""
+        if self._http_cache_fp is not None:
+            try:
+                self._http_cache_fp.close()
+            except IOError:
+                pass
+            self._http_cache_fp = None
+        tmp_file = f"{self.http_cache_file}.tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(b''.join(
+                    fastjson.dumps({'u': url, **entry}) + b'\n'
+                    for url, entry in self.http_cache.items()
+                ))
+            os.replace(tmp_file, self.http_cache_file)
+        except IOError as e:
+            print(f"Error compacting HTTP cache: {e}")
+            return
+        self._http_cache_lines = len(self.http_cache)
     
-    def _save_checkpoint(self):
-        """Save checkpoint to JSON file."""
+    def store_response(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+        """
+        Cache a fetched page so it can be reused while fresh and the next
+        fetch after that can be a conditional GET.
+        
+        Args:
+            url: Fetched URL
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            body: Response body
+        """
+        path = self._body_path(url)
+        tmp_file = f"{path}.{threading.get_ident()}.tmp"
+        entry = {'etag': etag, 'last_modified': last_modified, 'fetched_at': int(time.time())}
         try:
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(self.checkpoint_data, f, indent=2)
+            os.makedirs(self.bodies_dir, exist_ok=True)
+            with gzip.open(tmp_file, 'wt', encoding='utf-8', compresslevel=6) as f:
+                f.write(body)
+            os.replace(tmp_file, path)
+            self._append_http_cache_entry(url, entry)
         except IOError as e:
-            print(f"Error saving checkpoint: {e}")
+            print(f"Error caching response: {e}")
     
-    def _save_completed_urls(self):
-        """Save completed URLs to text file."""
+    def refresh_response(self, url: str):
+        """Mark the cached copy of a URL as fresh again (after a 304 response)."""
+        entry = self.http_cache.get(url)
+        if not entry:
+            return
         try:
-            with open(self.completed_urls_file, 'w') as f:
+            self._append_http_cache_entry(url, {**entry, 'fetched_at': int(time.time())})
+        except IOError as e:
+            print(f"Error caching response: {e}")
+    
+    def _close_log_fp(self):
+        """Close the delta log if it is open."""
+        if self._log_fp is not None:
+            try:
+                self._log_fp.close()
+            except IOError:
+                pass
+            self._log_fp = None
+    
+    def _save_checkpoint(self, sync: bool = False, force: bool = False):
+        """
+        Append the records of URLs changed since the last save to the delta log.
+        
+        Args:
+            sync: fsync the log so the changes survive a crash
+            force: Write now instead of waiting for FLUSH_EVERY changes or
+                FLUSH_INTERVAL seconds
+        """
+        with self._lock:
+            self._sync_pending = self._sync_pending or sync
+            if self._batch_depth or not self._dirty:
+                return
+            if (not force and len(self._dirty) < self.FLUSH_EVERY
+                    and time.monotonic() - self._last_flush < self.FLUSH_INTERVAL):
+                return
+            sync, self._sync_pending = self._sync_pending, False
+            urls = self.urls
+            lines = b''.join(
+                fastjson.dumps({'u': urls[idx], 'd': self._record(idx)}) + b'\n'
+                for idx in self._dirty
+            )
+            try:
+                if self._log_fp is None:
+                    self._log_fp = open(self.checkpoint_log_file, 'ab')
+                self._log_fp.write(lines)
+                self._log_fp.flush()
+                if sync:
+                    os.fsync(self._log_fp.fileno())
+            except IOError as e:
+                print(f"Error saving checkpoint: {e}")
+                return
+            
+            self._last_flush = time.monotonic()
+            self._log_lines += len(self._dirty)
+            self._dirty.clear()
+            if self._log_lines >= self.MERGE_EVERY:
+                self.merge()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group state changes so the delta log is written (and fsynced) once.
+        
+        Usage:
+            with checkpoint.batch():
+                for url in urls:
+                    checkpoint.mark_discovered(url)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._save_checkpoint(force=True)
+    
+    def flush(self):
+        """Write all pending changes to the delta log now."""
+        self._save_checkpoint(force=True)
+    
+    def merge(self):
+        """Fold the delta log into the base snapshot and truncate the log."""
+        with self._lock:
+            self._save_checkpoint(force=True)
+            self._close_log_fp()
+            tmp_file = f"{self.checkpoint_file}.tmp"
+            snapshot = {url: self._record(idx) for idx, url in enumerate(self.urls)}
+            try:
+                # The snapshot repeats the same URL prefix, statuses and dates on
+                # every record, so it compresses many times over; a low gzip level
+                # keeps merges fast
+                with open(tmp_file, 'wb') as f:
+                    with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=3) as gz:
+                        gz.write(fastjson.dumps(snapshot))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.checkpoint_file)
+                if os.path.exists(self.checkpoint_log_file):
+                    os.remove(self.checkpoint_log_file)
+                if os.path.exists(self.legacy_checkpoint_file):
+                    os.remove(self.legacy_checkpoint_file)
+            except IOError as e:
+                print(f"Error merging checkpoint: {e}")
+                return
+            self._log_lines = 0
+    
+    def _append_completed_url(self, url: str):
+        """Append a completed URL to the completed URLs log."""
+        try:
+            if self._completed_fp is None:
+                self._completed_fp = open(self.completed_urls_file, 'a', buffering=1)
+            self._completed_fp.write(f"{url}\n")
+        except IOError as e:
+            print(f"Error saving completed URLs: {e}")
+            return
+        
+        self._appends_since_compact += 1
+        if self._appends_since_compact >= self.COMPACT_EVERY:
+            self.compact()
+    
+    def _close_completed_fp(self):
+        """Close the completed URLs log if it is open."""
+        if self._completed_fp is not None:
+            try:
+                self._completed_fp.close()
+            except IOError:
+                pass
+            self._completed_fp = None
+    
+    def compact(self):
+        """Rewrite the completed URLs log sorted and without duplicates."""
+        self._close_completed_fp()
+        tmp_file = f"{self.completed_urls_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
                 for url in sorted(self.completed_urls):
                     f.write(f"{url}\n")
+            os.replace(tmp_file, self.completed_urls_file)
         except IOError as e:
-            print(f"Error saving completed URLs: {e}")
+            print(f"Error compacting completed URLs: {e}")
+            return
+        self._appends_since_compact = 0
+    
+    def close(self):
+        """Flush pending state to disk (called automatically at exit)."""
+        with self._lock:
+            self._save_checkpoint(force=True)
+            if self._log_lines and os.path.exists(self.checkpoint_log_file):
+                self.merge()
+            self._close_log_fp()
+            self._close_completed_fp()
+            with self._http_cache_lock:
+                if self._http_cache_lines > len(self.http_cache):
+                    self._compact_http_cache()
+                elif self._http_cache_fp is not None:
+                    try:
+                        self._http_cache_fp.close()
+                    except IOError:
+                        pass
+                    self._http_cache_fp = None
+            if self._appends_since_compact and os.path.exists(self.completed_urls_file):
+                self.compact()
     
     def get_status(self, url: str) -> Optional[str]:
         """
@@ -80,9 +569,26 @@ class Checkpoint:
         Returns:
             Status string or None if not found
         """
-        if url in self.checkpoint_data:
-            return self.checkpoint_data[url].get('status')
-        return None
+        idx = self.url_idx.get(url)
+        if idx is None or self.status[idx] == STATUS_NONE:
+            return None
+        return STATUS_NAMES[self.status[idx]]
+    
+    def get_record(self, url: str) -> Optional[Dict]:
+        """
+        Get the stored record of a URL.
+        
+        Args:
+            url: URL to look up
+            
+        Returns:
+            Dict with 'status', 'timestamp' and, when set, 'error',
+            'category' and 'subcategory'; None if the URL is unknown
+        """
+        idx = self.url_idx.get(url)
+        if idx is None:
+            return None
+        return self._record(idx)
     
     def is_completed(self, url: str) -> bool:
         """
@@ -96,74 +602,87 @@ class Checkpoint:
         """
         return url in self.completed_urls
     
+    def _transition(self, url: str, code: int) -> int:
+        """Set the status and timestamp of a URL and mark it dirty."""
+        idx = self._index(url)
+        self.status[idx] = code
+        self.timestamps[idx] = time.time()
+        self._dirty.add(idx)
+        return idx
+    
     def mark_discovered(self, url: str):
         """Mark URL as discovered."""
-        self.checkpoint_data[url] = {
-            'status': 'discovered',
-            'timestamp': datetime.now().isoformat()
-        }
-        self._save_checkpoint()
+        with self._lock:
+            idx = self._transition(url, STATUS_DISCOVERED)
+            self.errors.pop(idx, None)
+            self.contexts.pop(idx, None)
+            self._save_checkpoint()
+    
+    def set_context(self, url: str, category: str, subcategory: str):
+        """Store the category/subcategory a URL was discovered under (used on resume)."""
+        with self._lock:
+            idx = self._index(url)
+            self.contexts[idx] = self._shared_context(category, subcategory)
+            self._dirty.add(idx)
+            self._save_checkpoint()
     
     def mark_parsed(self, url: str):
         """Mark URL as parsed."""
-        if url not in self.checkpoint_data:
-            self.checkpoint_data[url] = {}
-        self.checkpoint_data[url]['status'] = 'parsed'
-        self.checkpoint_data[url]['timestamp'] = datetime.now().isoformat()
-        self._save_checkpoint()
+        with self._lock:
+            self._transition(url, STATUS_PARSED)
+            self._save_checkpoint()
     
     def mark_saved(self, url: str):
         """Mark URL as saved (completed)."""
-        if url not in self.checkpoint_data:
-            self.checkpoint_data[url] = {}
-        self.checkpoint_data[url]['status'] = 'saved'
-        self.checkpoint_data[url]['timestamp'] = datetime.now().isoformat()
-        self.completed_urls.add(url)
-        self._save_checkpoint()
-        self._save_completed_urls()
+        with self._lock:
+            idx = self._transition(url, STATUS_SAVED)
+            self.completed_urls.add(self.urls[idx])
+            # The completed URL is logged first: if the process dies before the
+            # status is written, loading reconciles the status from it
+            self._append_completed_url(url)
+            self._save_checkpoint(sync=True, force=True)
     
     def mark_failed(self, url: str, error: str = ""):
         """Mark URL as failed."""
-        if url not in self.checkpoint_data:
-            self.checkpoint_data[url] = {}
-        self.checkpoint_data[url]['status'] = 'failed'
-        self.checkpoint_data[url]['error'] = error
-        self.checkpoint_data[url]['timestamp'] = datetime.now().isoformat()
-        self._save_checkpoint()
+        with self._lock:
+            idx = self._transition(url, STATUS_FAILED)
+            self.errors[idx] = sys.intern(error)
+            self._save_checkpoint()
     
     def get_incomplete_urls(self) -> list:
         """Get list of URLs that are not completed."""
-        incomplete = []
-        for url, data in self.checkpoint_data.items():
-            if data.get('status') != 'saved':
-                incomplete.append(url)
-        return incomplete
+        # Map the status column to a 0/1 mask in one translate() call and let
+        # compress() pick the URLs, so no Python code runs per URL
+        mask = self.status.tobytes().translate(_INCOMPLETE_MASK)
+        return list(compress(self.urls, mask))
     
     def get_statistics(self) -> Dict[str, int]:
         """Get checkpoint statistics."""
-        stats = {
-            'total': len(self.checkpoint_data),
-            'discovered': 0,
-            'parsed': 0,
-            'saved': 0,
-            'failed': 0
-        }
-        
-        for url, data in self.checkpoint_data.items():
-            status = data.get('status', 'unknown')
-            if status in stats:
-                stats[status] += 1
-        
+        # One C-level count over the status column per status
+        codes = self.status.tobytes()
+        stats = {'total': len(self.urls)}
+        for code, name in enumerate(STATUS_NAMES):
+            stats[name] = codes.count(code)
         return stats
     
     def reset(self):
         """Reset checkpoint (use with caution)."""
-        self.checkpoint_data = {}
-        self.completed_urls = set()
-        if os.path.exists(self.checkpoint_file):
-            os.remove(self.checkpoint_file)
-        if os.path.exists(self.completed_urls_file):
-            os.remove(self.completed_urls_file)
+        with self._lock:
+            self._close_log_fp()
+            self._close_completed_fp()
+            self._appends_since_compact = 0
+            self._log_lines = 0
+            self._dirty.clear()
+            self._init_state()
+            self.completed_urls = set()
+            if os.path.exists(self.checkpoint_file):
+                os.remove(self.checkpoint_file)
+            if os.path.exists(self.legacy_checkpoint_file):
+                os.remove(self.legacy_checkpoint_file)
+            if os.path.exists(self.checkpoint_log_file):
+                os.remove(self.checkpoint_log_file)
+            if os.path.exists(self.completed_urls_file):
+                os.remove(self.completed_urls_file)
 
 
 if __name__ == "__main__":
@@ -2,18 +2,115 @@
 Discovery logic for finding categories, subcategories, and model URLs.
 """
 
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import copy
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+from lxml import etree
+from typing import Any, Callable, List, Dict, Optional, Set
 from .fetcher import Fetcher
+from .html_tree import parse_html
+
+
+# Bump when an extractor's output changes so stale parse results on disk
+# are not reused
+PARSE_CACHE_VERSION = 2
+# Parse results kept in memory, least recently used evicted first
+PARSE_CACHE_SIZE = 256
+
+# Link queries are compiled once and evaluated by libxml2 instead of
+# walking every anchor in Python
+_EXPLORE_LINKS_XPATH = etree.XPath("//a[starts-with(@href, '/explore/')]")
+_HREF_CONTAINS_XPATH = etree.XPath("//a[contains(@href, $fragment)]")
+_SUBCAT_SECTION_LINK_XPATH = etree.XPath(
+    "//span[contains(concat(' ', normalize-space(@class), ' '), ' seDi ')]/descendant::a[1]"
+)
+_MODEL_HREFS_XPATH = etree.XPath("//a[not(contains(@href, '-wallpapers'))]/@href")
+_ALL_HREFS_XPATH = etree.XPath("//a/@href")
+
+# URL shapes are matched by one compiled pattern per link instead of a chain
+# of startswith/split/count calls; they end in \Z rather than $, which would
+# also accept a trailing newline
+# Main category: /explore/{category}/
+_MAIN_CATEGORY_HREF_RE = re.compile(r'^/explore/([^/]+)/*\Z')
+# Model detail page: /{make}/{year}-{model}
+_MODEL_HREF_RE = re.compile(r'^/[^/]+/[^/]*-[^/]*\Z')
+# Make page: /{make}/ (anything under /explore is navigation, not a make)
+_MAKE_HREF_RE = re.compile(r'^/(?!explore)[^/]+/\Z')
 
 
 class Discovery:
     """Handles discovery of categories, subcategories, and model listings."""
     
-    def __init__(self, fetcher: Optional[Fetcher] = None):
-        """Initialize discovery with optional fetcher."""
+    def __init__(self, fetcher: Optional[Fetcher] = None, cache_dir: Optional[str] = None):
+        """
+        Initialize discovery with optional fetcher.
+        
+        Args:
+            fetcher: Fetcher used to download pages
+            cache_dir: Directory for parse results keyed by page content digest,
+                so unchanged pages are not re-parsed across runs (in-memory only if None)
+        """
         self.fetcher = fetcher or Fetcher()
         self.base_url = "https://www.netcarshow.com"
+        self.cache_dir = cache_dir
+        self._parse_cache: 'OrderedDict[str, Any]' = OrderedDict()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+    
+    def _parse_cached(self, html: str, extract: Callable, *args) -> Any:
+        """
+        Run extract(doc, *args) on the parsed page, reusing the result for identical content.
+        
+        Args:
+            html: Page HTML
+            extract: Extraction method taking the lxml document and args
+            args: Extra arguments that the result depends on
+            
+        Returns:
+            Copy of the extraction result, so callers may modify it (empty
+            list if the page cannot be parsed)
+        """
+        hasher = hashlib.blake2b(html.encode('utf-8'), digest_size=16)
+        hasher.update(repr((PARSE_CACHE_VERSION, extract.__name__, args)).encode('utf-8'))
+        digest = hasher.hexdigest()
+        
+        if digest in self._parse_cache:
+            self._parse_cache.move_to_end(digest)
+            return copy.deepcopy(self._parse_cache[digest])
+        
+        cache_file = os.path.join(self.cache_dir, f"{digest}.json") if self.cache_dir else None
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    result = json.load(f)
+                self._remember_parse(digest, result)
+                return copy.deepcopy(result)
+            except (json.JSONDecodeError, IOError):
+                pass
+        
+        doc = parse_html(html)
+        if doc is None:
+            return []
+        result = extract(doc, *args)
+        
+        self._remember_parse(digest, result)
+        if cache_file:
+            try:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, ensure_ascii=False)
+            except IOError:
+                pass
+        return copy.deepcopy(result)
+    
+    def _remember_parse(self, digest: str, result: Any):
+        """Keep a parse result in memory, evicting the least recently used beyond PARSE_CACHE_SIZE."""
+        self._parse_cache[digest] = result
+        self._parse_cache.move_to_end(digest)
+        while len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
     
     def discover_main_categories(self) -> List[Dict[str, str]]:
         """
@@ -26,29 +123,30 @@ class Discovery:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
+        return self._parse_cached(html, self._extract_main_categories)
+    
+    def _extract_main_categories(self, doc) -> List[Dict[str, str]]:
+        """Extract main category links from a parsed homepage."""
         categories = []
         
         # Find all category links in the Explore section
         # Categories are in links like /explore/coupe/, /explore/sedan/, etc.
-        explore_links = soup.find_all('a', href=lambda x: x and x.startswith('/explore/'))
+        explore_links = _EXPLORE_LINKS_XPATH(doc)
         
         seen = set()
         for link in explore_links:
             href = link.get('href', '')
             # Filter out subcategory links (they have more path segments)
-            # Main categories: /explore/coupe/ (2 segments after stripping)
-            # Subcategories: /explore/crossover-suv/premium/ (3 segments after stripping)
-            href_clean = href.rstrip('/')
-            parts = href_clean.split('/')
-            # Main category has exactly 2 parts: ['', 'explore', 'category']
-            if len(parts) == 3 and parts[1] == 'explore' and href not in seen:
+            # Main categories: /explore/coupe/
+            # Subcategories: /explore/crossover-suv/premium/
+            match = _MAIN_CATEGORY_HREF_RE.match(href)
+            if match and href not in seen:
                 seen.add(href)
-                category_name = parts[2] if len(parts) > 2 else ''
-                name = link.get_text().strip() or category_name.replace('-', ' ').title()
+                category_name = match.group(1)
+                name = link.text_content().strip() or category_name.replace('-', ' ').title()
                 categories.append({
                     'name': name,
-                    'url': f"{self.base_url}{href_clean}",
+                    'url': f"{self.base_url}/explore/{category_name}",
                     'type': category_name
                 })
         
@@ -68,27 +166,29 @@ class Discovery:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
-        subcategories = []
-        
         # Look for subcategory links - they appear as "SHOW MORE" links or direct links
         # Pattern: /explore/{category}/{subcategory}/
         category_type = category_url.rstrip('/').split('/')[-1]
+        return self._parse_cached(html, self._extract_subcategories, category_type)
+    
+    def _extract_subcategories(self, doc, category_type: str) -> List[Dict[str, str]]:
+        """Extract subcategory links of category_type from a parsed category page."""
+        subcategories = []
         
         # Find links that match the subcategory pattern
-        all_links = soup.find_all('a', href=True)
-        seen = set()
+        candidate_links = _HREF_CONTAINS_XPATH(doc, fragment=f'/explore/{category_type}/')
+        seen: Set[str] = set()
         
-        for link in all_links:
+        for link in candidate_links:
             href = link.get('href', '')
             # Check if it's a subcategory link
-            if f'/explore/{category_type}/' in href and href.count('/') == 4:
+            if href.count('/') == 4:
                 if href not in seen:
                     seen.add(href)
                     # Extract subcategory name from URL or link text
                     subcat_name = href.rstrip('/').split('/')[-1]
                     # Try to get better name from link text or nearby elements
-                    link_text = link.get_text().strip()
+                    link_text = link.text_content().strip()
                     if link_text and 'show more' not in link_text.lower():
                         subcat_name = link_text
                     
@@ -100,19 +200,16 @@ class Discovery:
         
         # Also look for subcategory section dividers (like "Premium SUV", "Midsize SUV")
         # These appear as <span class="seDi"> elements with links
-        subcat_sections = soup.find_all('span', class_='seDi')
-        for section in subcat_sections:
-            link = section.find('a')
-            if link:
-                href = link.get('href', '')
-                if href and href not in seen:
-                    seen.add(href)
-                    name = link.get_text().strip()
-                    subcategories.append({
-                        'name': name,
-                        'url': f"{self.base_url}{href}",
-                        'subtype': href.rstrip('/').split('/')[-1]
-                    })
+        for link in _SUBCAT_SECTION_LINK_XPATH(doc):
+            href = link.get('href', '')
+            if href and href not in seen:
+                seen.add(href)
+                name = link.text_content().strip()
+                subcategories.append({
+                    'name': name,
+                    'url': f"{self.base_url}{href}",
+                    'subtype': href.rstrip('/').split('/')[-1]
+                })
         
         return subcategories
     
@@ -130,27 +227,51 @@ class Discovery:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
+        return self._parse_cached(html, self._extract_model_urls)
+    
+    def _extract_model_urls(self, doc) -> List[str]:
+        """Extract model detail page URLs from a parsed listing page."""
         model_urls = []
         
-        # Find all links to model detail pages
+        # Find all links to model detail pages (gallery links are excluded by the query)
         # Pattern: /{make}/{year}-{model}/
-        all_links = soup.find_all('a', href=True)
-        seen = set()
+        # Keyed on href so duplicate links never build the full URL string
+        seen: Set[str] = set()
         
-        for link in all_links:
-            href = link.get('href', '')
-            # Model URLs have pattern: /make/year-model/ (not ending in -wallpapers)
-            if href.startswith('/') and '/' in href[1:] and not href.endswith('/'):
-                parts = href.strip('/').split('/')
-                if len(parts) == 2 and '-' in parts[1] and '-wallpapers' not in href:
-                    full_url = f"{self.base_url}{href}"
-                    if full_url not in seen:
-                        seen.add(full_url)
-                        model_urls.append(full_url)
+        match_model = _MODEL_HREF_RE.match
+        for href in _MODEL_HREFS_XPATH(doc):
+            # Model URLs have pattern: /make/year-model (not ending in -wallpapers)
+            if match_model(href):
+                if href not in seen:
+                    seen.add(href)
+                    model_urls.append(f"{self.base_url}{href}")
         
         return model_urls
 
+    def extract_make_urls(self, html: str) -> List[str]:
+        """
+        Extract make page URLs (like /bmw/, /mercedes-benz/) from a listing page.
+        
+        Args:
+            html: HTML of a listing page
+            
+        Returns:
+            List of make page URLs in page order, without duplicates
+        """
+        doc = parse_html(html)
+        if doc is None:
+            return []
+        
+        make_urls = []
+        seen: Set[str] = set()
+        match_make = _MAKE_HREF_RE.match
+        for href in _ALL_HREFS_XPATH(doc):
+            if match_make(href):
+                if href not in seen:
+                    seen.add(href)
+                    make_urls.append(f"{self.base_url}{href}")
+        return make_urls
+
 
 if __name__ == "__main__":
     # Test discovery
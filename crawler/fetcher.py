@@ -2,9 +2,12 @@
 HTTP Fetcher with rate limiting and error handling for NetCarShow crawler.
 """
 
+import os
 import time
+import threading
 import requests
-from typing import Optional, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, Iterable, Iterator
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -12,21 +15,39 @@ from urllib3.util.retry import Retry
 class Fetcher:
     """Handles HTTP requests with rate limiting and retry logic."""
     
-    def __init__(self, rate_limit: float = 3.0, max_retries: int = 5):
+    def __init__(self, rate_limit: float = 3.0, max_retries: int = 5, max_concurrency: int = 8):
         """
         Initialize fetcher.
         
         Args:
             rate_limit: Seconds between requests (default 3.0)
             max_retries: Maximum retry attempts for failed requests
+            max_concurrency: Maximum in-flight requests for fetch_urls (default 8)
         """
         self.rate_limit = rate_limit
-        self.last_request_time = 0
+        self.max_concurrency = max(1, max_concurrency)
+        # Request slots are tracked in integer nanoseconds on the monotonic clock,
+        # which unlike time.time() never jumps when the system clock is adjusted
+        self._rate_limit_ns = int(rate_limit * 1_000_000_000)
+        self._next_request_ns = 0
+        self._rate_lock = threading.Lock()
         self.session = requests.Session()
         self.max_retries = max_retries
         
+        # Optional store of previously fetched pages (e.g. Checkpoint) providing
+        # get_conditional_headers/load_cached_body/load_fresh_body/store_response/
+        # refresh_response/drop_response; when set, unchanged pages are
+        # revalidated with conditional GETs
+        self.http_cache = None
+        # Pages cached less than this many seconds ago are served from
+        # http_cache without a request (0 disables)
+        self.cache_ttl = 0.0
+        # Numbered pagination pages fetched ahead of need (0 disables); each
+        # one takes a rate-limit slot, so this only pays off when rate_limit
+        # is below the round-trip time
+        self.prefetch_pages = 0
+        
         # Configure proxy from environment variables if available
-        import os
         self.proxies = {}
         if os.environ.get('http_proxy'):
             self.proxies['http'] = os.environ.get('http_proxy')
@@ -41,10 +62,14 @@ class Fetcher:
             allowed_methods=["GET", "HEAD"],
             raise_on_status=False
         )
+        # The crawl talks to a single origin, so one host pool is enough; it keeps
+        # a reusable keep-alive connection per concurrent worker, and blocking on
+        # an exhausted pool reuses connections instead of opening throwaway ones
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=10
+            pool_connections=1,
+            pool_maxsize=max(32, self.max_concurrency),
+            pool_block=True
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
@@ -60,25 +85,70 @@ class Fetcher:
         })
     
     def _wait_for_rate_limit(self):
-        """Wait if necessary to respect rate limit."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self.last_request_time = time.time()
+        """
+        Wait if necessary to respect rate limit.
+        
+        Each caller reserves the next free request slot under a lock and then
+        sleeps outside of it, so concurrent workers are spaced rate_limit apart
+        while their network round-trips overlap.
+        """
+        with self._rate_lock:
+            now = time.monotonic_ns()
+            slot = max(now, self._next_request_ns)
+            self._next_request_ns = slot + self._rate_limit_ns
+        if slot > now:
+            time.sleep((slot - now) / 1_000_000_000)
+    
+    @staticmethod
+    def _decode_body(response: requests.Response) -> str:
+        """
+        Decode a response body without requests' charset detection.
+        
+        Uses the charset declared in Content-Type and falls back to UTF-8
+        (what NetCarShow serves), instead of response.text, which may run
+        character-set sniffing over the whole body.
+        """
+        encoding = 'utf-8'
+        if 'charset=' in response.headers.get('Content-Type', '').lower() and response.encoding:
+            encoding = response.encoding
+        try:
+            return response.content.decode(encoding, errors='replace')
+        except LookupError:
+            # Unknown charset name in the header
+            return response.content.decode('utf-8', errors='replace')
     
     def fetch_url(self, url: str, timeout: int = 60,
-                  headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+                  headers: Optional[Dict[str, str]] = None,
+                  conditional_headers: Optional[Dict[str, str]] = None
+                  ) -> Tuple[Optional[str], Optional[int], Optional[str]]:
         """
         Fetch URL with rate limiting, retries, and error handling.
         
         Args:
             url: URL to fetch
             timeout: Request timeout in seconds (increased default to 60)
+            headers: Extra request headers
+            conditional_headers: If-None-Match/If-Modified-Since headers; taken
+                from http_cache when not given
             
         Returns:
             Tuple of (html_content, status_code, error_message)
-            Returns (None, status_code, error) on failure
+            Returns (None, status_code, error) on failure. A 304 response
+            returns the cached body with status 304; a page served from the
+            cache without a request returns status 200. A 304 for a page
+            whose cached body is gone is refetched without validators.
         """
+        cache = self.http_cache
+        if conditional_headers is None and cache is not None:
+            if self.cache_ttl > 0:
+                body = cache.load_fresh_body(url, self.cache_ttl)
+                if body is not None:
+                    return body, 200, None
+            conditional_headers = cache.get_conditional_headers(url)
+        request_headers = headers
+        if conditional_headers:
+            request_headers = {**(headers or {}), **conditional_headers}
+        
         self._wait_for_rate_limit()
         
         # Manual retry loop for connection errors
@@ -90,11 +160,30 @@ class Fetcher:
                     timeout=timeout,
                     allow_redirects=True,
                     stream=False,
-                    headers=headers,
+                    headers=request_headers,
                     proxies=self.proxies if self.proxies else None
                 )
+                if response.status_code == 304 and cache is not None:
+                    body = cache.load_cached_body(url)
+                    if body is not None:
+                        cache.refresh_response(url)
+                        return body, 304, None
+                    # The validators outlived the body they describe; forget
+                    # them and ask for the full page once more
+                    cache.drop_response(url)
+                    if conditional_headers:
+                        return self.fetch_url(url, timeout=timeout, headers=headers, conditional_headers={})
+                    return None, 304, "Not modified, but no cached body available"
                 response.raise_for_status()
-                return response.text, response.status_code, None
+                body = self._decode_body(response)
+                if cache is not None:
+                    cache.store_response(
+                        url,
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                        body
+                    )
+                return body, response.status_code, None
                 
             except requests.exceptions.Timeout as e:
                 last_error = f"Timeout after {timeout}s"
@@ -152,6 +241,42 @@ class Fetcher:
             # Only print error on final failure (after all retries)
             pass  # Errors are logged by the logger, no need to print here
         return html
+    
+    def fetch_urls(self, urls: Iterable[str], timeout: int = 60,
+                   headers: Optional[Dict[str, str]] = None,
+                   max_concurrency: Optional[int] = None
+                   ) -> Iterator[Tuple[str, Optional[str], Optional[int], Optional[str]]]:
+        """
+        Fetch several URLs concurrently while still honoring the rate limit.
+        
+        Requests are started no faster than rate_limit allows, but up to
+        max_concurrency of them may be in flight at once, so a slow response
+        no longer holds up the next request.
+        
+        Args:
+            urls: URLs to fetch
+            timeout: Request timeout in seconds
+            headers: Extra headers sent with every request
+            max_concurrency: Override for the number of in-flight requests
+            
+        Returns:
+            Iterator of (url, html_content, status_code, error_message) tuples,
+            yielded in the same order as urls
+        """
+        urls = list(urls)
+        workers = min(max_concurrency or self.max_concurrency, len(urls))
+        if workers <= 1:
+            return ((url, *self.fetch_url(url, timeout=timeout, headers=headers)) for url in urls)
+        return self._fetch_urls_concurrently(urls, workers, timeout, headers)
+    
+    def _fetch_urls_concurrently(self, urls, workers, timeout, headers):
+        """Yield fetch results in order from a bounded worker pool."""
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda url: self.fetch_url(url, timeout=timeout, headers=headers), urls
+            )
+            for url, (html, status, error) in zip(urls, results):
+                yield url, html, status, error
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+"""
+Shared lxml helpers for parsing HTML without BeautifulSoup's per-node wrappers.
+"""
+
+from typing import Optional
+from lxml import etree
+from lxml import html as lxml_html
+
+
+def parse_html(html: str):
+    """Parse HTML into an lxml tree, returning None if it cannot be parsed."""
+    try:
+        try:
+            return lxml_html.fromstring(html)
+        except ValueError:
+            # Unicode input with an XML encoding declaration must be passed as bytes
+            return lxml_html.fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        return None
+
+
+def element_string(element) -> Optional[str]:
+    """
+    Return an element's only string, following BeautifulSoup's Tag.string.
+    
+    Args:
+        element: lxml element
+    
+    Returns:
+        The text if the element holds exactly one string (possibly nested in
+        a chain of single children), otherwise None
+    """
+    while True:
+        children = len(element)
+        if children == 0:
+            return element.text or None
+        if children > 1 or element.text:
+            return None
+        child = element[0]
+        if child.tail:
+            return None
+        if not isinstance(child.tag, str):
+            # Comments and processing instructions count as the string
+            return child.text
+        element = child
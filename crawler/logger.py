@@ -2,16 +2,34 @@
 Structured logging for the crawler.
 """
 
-import json
+import atexit
 import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from . import fastjson
+    from .timestamps import format_time_ns
+except ImportError:  # run directly as a script
+    import fastjson
+    from timestamps import format_time_ns
 
 
 class CrawlerLogger:
     """Structured logger for crawler operations."""
     
+    # Most entries the background writer serializes and appends in one write
+    BATCH_SIZE = 256
+    
+    # Seconds between writes of buffered progress output to stdout
+    PROGRESS_INTERVAL = 0.25
+    
     def __init__(self, log_dir: str = "logs"):
         """
         Initialize logger.
@@ -25,6 +43,21 @@ class CrawlerLogger:
         # Create log file with date
         date_str = datetime.now().strftime("%Y%m%d")
         self.log_file = os.path.join(log_dir, f"crawl_{date_str}.log")
+        
+        # Entries are queued and written by a background thread, so logging
+        # never blocks the crawl on disk I/O; the append handle stays open
+        # across batches (opened on first write)
+        self._log_fp = None
+        self._queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        
+        # Console progress is buffered too and written by its own thread every
+        # PROGRESS_INTERVAL, so crawl threads never contend on stdout
+        self._progress: deque = deque()
+        self._progress_writer: Optional[threading.Thread] = None
+        self._progress_stop = threading.Event()
+        atexit.register(self.close)
     
     def _write_log(self, level: str, message: str, **kwargs):
         """
@@ -36,18 +69,125 @@ class CrawlerLogger:
             **kwargs: Additional fields to include in log
         """
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
             'level': level,
             'message': message,
             **kwargs
         }
         
+        # Only the raw clock is read here; the writer thread formats it
+        if self._writer is None:
+            self._start_writer()
+        self._queue.put((time.time_ns(), log_entry))
+    
+    def _start_writer(self):
+        """Start the background writer thread if it is not running."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._drain, name="CrawlerLogger", daemon=True)
+                self._writer.start()
+    
+    def _drain(self):
+        """Background writer: append queued entries in batches until a None sentinel."""
+        while True:
+            entries = [self._queue.get()]
+            while len(entries) < self.BATCH_SIZE:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._append_entries([entry for entry in entries if entry is not None])
+            finally:
+                for _ in entries:
+                    self._queue.task_done()
+            if None in entries:
+                return
+    
+    def _append_entries(self, entries: List[Tuple[int, Dict[str, Any]]]):
+        """
+        Serialize entries and append them to the log file with one write.
+        
+        Args:
+            entries: (time_ns, log entry) pairs in the order they were logged
+        """
+        lines = []
+        for time_ns, entry in entries:
+            try:
+                lines.append(fastjson.dumps({'timestamp': format_time_ns(time_ns), **entry}) + b'\n')
+            except (TypeError, ValueError):
+                print(f"[{entry['level']}] {entry['message']}")
+        if not lines:
+            return
+        
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            if self._log_fp is None:
+                self._log_fp = open(self.log_file, 'ab')
+            self._log_fp.write(b''.join(lines))
+            self._log_fp.flush()
         except IOError:
             # Fallback to stdout if file write fails
-            print(f"[{level}] {message}")
+            for _, entry in entries:
+                print(f"[{entry['level']}] {entry['message']}")
+    
+    def progress(self, message: str, end: str = "\n"):
+        """
+        Print a console progress message without blocking on stdout.
+        
+        Args:
+            message: Text to print
+            end: Appended after message, as with print()
+        """
+        if self._progress_writer is None:
+            self._start_progress_writer()
+        self._progress.append(message + end)
+    
+    def _start_progress_writer(self):
+        """Start the background progress thread if it is not running."""
+        with self._writer_lock:
+            if self._progress_writer is None:
+                self._progress_stop.clear()
+                self._progress_writer = threading.Thread(target=self._drain_progress,
+                                                         name="CrawlerProgress", daemon=True)
+                self._progress_writer.start()
+    
+    def _drain_progress(self):
+        """Background writer: print buffered progress every PROGRESS_INTERVAL until stopped."""
+        while not self._progress_stop.wait(self.PROGRESS_INTERVAL):
+            self._write_progress()
+        self._write_progress()
+    
+    def _write_progress(self):
+        """Write all buffered progress messages to stdout at once."""
+        parts = []
+        while self._progress:
+            parts.append(self._progress.popleft())
+        if parts:
+            sys.stdout.write(''.join(parts))
+            sys.stdout.flush()
+    
+    def flush(self):
+        """Block until every entry logged so far has been written to the log file."""
+        if self._writer is not None:
+            self._queue.join()
+    
+    def close(self):
+        """Write pending entries and close the log file (called automatically at exit)."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+            progress_writer, self._progress_writer = self._progress_writer, None
+        if progress_writer is not None:
+            self._progress_stop.set()
+            progress_writer.join()
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
+        if self._log_fp is not None:
+            try:
+                self._log_fp.close()
+            except IOError:
+                pass
+            self._log_fp = None
     
     def info(self, message: str, url: Optional[str] = None, **kwargs):
         """Log info message."""
@@ -4,38 +4,56 @@ Main crawler orchestration - ties all components together.
 
 import os
 import sys
-from typing import List, Dict, Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 
 # Handle both package import and direct import
 try:
     from .fetcher import Fetcher
     from .discovery import Discovery
     from .parser import Parser
-    from .gallery import GalleryParser
+    from .gallery import GalleryParser, prefetch_numbered_pages
     from .schema import SchemaMapper
     from .validator import Validator
     from .saver import Saver
     from .checkpoint import Checkpoint
     from .logger import CrawlerLogger
+    from .parse_pool import ParsePool, parse_listing_html, parse_model_html
 except ImportError:
     # If running as script, add parent directory to path
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from crawler.fetcher import Fetcher
     from crawler.discovery import Discovery
     from crawler.parser import Parser
-    from crawler.gallery import GalleryParser
+    from crawler.gallery import GalleryParser, prefetch_numbered_pages
     from crawler.schema import SchemaMapper
     from crawler.validator import Validator
     from crawler.saver import Saver
     from crawler.checkpoint import Checkpoint
     from crawler.logger import CrawlerLogger
+    from crawler.parse_pool import ParsePool, parse_listing_html, parse_model_html
 
 
 class Crawler:
     """Main crawler that orchestrates all components."""
     
+    # Model pages are fetched, parsed and checkpointed in batches of this size
+    BATCH_SIZE = 64
+    
+    # A listing page linking this many models directly is treated as a full
+    # model listing, and its make pages are not traversed (None always
+    # traverses them). Models linked only from make pages are then missed, so
+    # this trades coverage for requests and is off by default
+    MAKE_TRAVERSAL_THRESHOLD: Optional[int] = None
+    
+    # Least number of seconds between per-model progress lines
+    PROGRESS_EVERY = 1.0
+    
     def __init__(self, output_dir: str = "data", checkpoint_dir: str = "checkpoints", 
-                 log_dir: str = "logs", rate_limit: float = 3.0):
+                 log_dir: str = "logs", rate_limit: float = 3.0, concurrency: int = 8,
+                 parse_workers: Optional[int] = None, cache_ttl: float = 86400, prefetch_pages: int = 0,
+                 make_traversal_threshold: Optional[int] = MAKE_TRAVERSAL_THRESHOLD):
         """
         Initialize crawler.
         
@@ -44,16 +62,98 @@ class Crawler:
             checkpoint_dir: Directory for checkpoint files
             log_dir: Directory for log files
             rate_limit: Seconds between requests
+            concurrency: Maximum number of requests in flight at once
+            parse_workers: Processes used for HTML parsing (default: CPU count)
+            cache_ttl: Seconds a fetched page is served from the checkpoint's
+                page cache without a request (0 always revalidates)
+            prefetch_pages: Numbered listing and gallery pages fetched ahead of
+                need (0 disables; only useful when rate_limit is below the
+                round-trip time)
+            make_traversal_threshold: Number of models linked directly from a
+                listing page at which its make pages are not fetched (None or 0
+                always fetches them; models only reachable through make pages
+                are skipped otherwise)
         """
-        self.fetcher = Fetcher(rate_limit=rate_limit)
-        self.discovery = Discovery(fetcher=self.fetcher)
+        self.fetcher = Fetcher(rate_limit=rate_limit, max_concurrency=concurrency)
+        self.discovery = Discovery(
+            fetcher=self.fetcher,
+            cache_dir=os.path.join(checkpoint_dir, "parsed")
+        )
         self.parser = Parser()
+        self.parse_pool = ParsePool(max_workers=parse_workers)
         self.gallery_parser = GalleryParser()
         self.saver = Saver(output_dir=output_dir)
         self.checkpoint = Checkpoint(checkpoint_dir=checkpoint_dir)
+        self.fetcher.http_cache = self.checkpoint
+        self.fetcher.cache_ttl = cache_ttl
+        self.fetcher.prefetch_pages = prefetch_pages
         self.logger = CrawlerLogger(log_dir=log_dir)
         
         self.output_dir = output_dir
+        self._make_traversal_threshold = make_traversal_threshold
+        self._last_progress = 0.0
+        
+        # The category tree is discovered once per crawler, not once per
+        # crawl_category call; subcategories are keyed by category URL
+        self._categories: Optional[List[Dict[str, str]]] = None
+        self._subcategories: Dict[str, List[Dict[str, str]]] = {}
+        # (category, subcategory), lower-cased -> listing URL found for it
+        self._category_urls: Dict[Tuple[str, str], str] = {}
+        # Listing pages of a category repeat the same make links, so each make
+        # page is fetched and parsed once per (make URL, category, subcategory)
+        self._make_page_models: Dict[Tuple[str, str, str], List[Dict]] = {}
+    
+    def _progress_due(self, idx: int, total: int) -> bool:
+        """Whether a per-model progress line should be shown (time-based, always for the last model)."""
+        now = time.monotonic()
+        if idx == total or now - self._last_progress >= self.PROGRESS_EVERY:
+            self._last_progress = now
+            return True
+        return False
+    
+    def _get_categories(self) -> List[Dict[str, str]]:
+        """Main categories, discovered on first use."""
+        if not self._categories:
+            self._categories = self.discovery.discover_main_categories()
+        return self._categories
+    
+    def _get_subcategories(self, category_url: str) -> List[Dict[str, str]]:
+        """Subcategories of a category, discovered on first use."""
+        subcats = self._subcategories.get(category_url)
+        if not subcats:
+            subcats = self._subcategories[category_url] = self.discovery.discover_subcategories(category_url)
+        return subcats
+    
+    def _find_category_url(self, category: str, subcategory: str) -> Optional[str]:
+        """
+        Find the listing URL of a category/subcategory.
+        
+        Names match a category's or subcategory's name or type exactly or as a
+        substring (case-insensitive); the first match in discovery order wins.
+        
+        Args:
+            category: Category name (e.g., "SUV")
+            subcategory: Subcategory name (e.g., "Premium")
+            
+        Returns:
+            Listing URL, or None if no subcategory matches
+        """
+        key = (category.lower(), subcategory.lower())
+        if key in self._category_urls:
+            return self._category_urls[key]
+        
+        category, subcategory = key
+        for cat in self._get_categories():
+            cat_name = cat.get('name', '').lower()
+            cat_type = cat.get('type', '').lower()
+            if category in cat_name or category in cat_type:
+                for subcat in self._get_subcategories(cat['url']):
+                    subcat_name = subcat.get('name', '').lower()
+                    subcat_type = subcat.get('subtype', '').lower()
+                    if subcategory in subcat_name or subcategory in subcat_type:
+                        self._category_urls[key] = subcat['url']
+                        return subcat['url']
+        return None
     
     def crawl_category(self, category: str, subcategory: str) -> Dict[str, int]:
         """
@@ -78,25 +178,7 @@ class Crawler:
         
         try:
             # Discover subcategory URL
-            categories = self.discovery.discover_main_categories()
-            category_url = None
-            
-            for cat in categories:
-                cat_name = cat.get('name', '').lower()
-                cat_type = cat.get('type', '').lower()
-                if cat_name == category.lower() or cat_type == category.lower() or category.lower() in cat_name or category.lower() in cat_type:
-                    subcats = self.discovery.discover_subcategories(cat['url'])
-                    for subcat in subcats:
-                        subcat_name = subcat.get('name', '').lower()
-                        subcat_type = subcat.get('subtype', '').lower()
-                        if (subcat_name == subcategory.lower() or 
-                            subcat_type == subcategory.lower() or
-                            subcategory.lower() in subcat_name or 
-                            subcategory.lower() in subcat_type):
-                            category_url = subcat['url']
-                            break
-                    if category_url:
-                        break
+            category_url = self._find_category_url(category, subcategory)
             
             if not category_url:
                 self.logger.error(f"Could not find category/subcategory: {category}/{subcategory}")
@@ -111,54 +193,59 @@ class Crawler:
                 models = self._process_listing_page(listing_url, category, subcategory)
                 stats['discovered'] += len(models)
                 
-                print(f"\n🚗 Found {len(models)} total models. Processing...")
+                self.logger.progress(f"\n🚗 Found {len(models)} total models. Processing...")
                 
-                # Process each model
-                for idx, model_info in enumerate(models, 1):
-                    model_url = model_info['url']
-                    make_model = f"{model_info.get('make', 'unknown')}/{model_info.get('model', 'unknown')}"
+                # Process models in batches: detail pages of a batch are fetched
+                # concurrently and parsed in the pool while later ones download,
+                # and checkpoint updates are written once per batch
+                for batch_start in range(0, len(models), self.BATCH_SIZE):
+                    pending = []
+                    for idx, model_info in enumerate(models[batch_start:batch_start + self.BATCH_SIZE],
+                                                     batch_start + 1):
+                        model_url = model_info['url']
+                        
+                        # Check checkpoint
+                        if self.checkpoint.is_completed(model_url):
+                            stats['skipped'] += 1
+                            if self._progress_due(idx, len(models)):
+                                self.logger.progress(f"  [{idx}/{len(models)}] Skipped (already completed)")
+                            self.logger.debug(f"Skipping already completed URL", url=model_url)
+                            continue
+                        pending.append((idx, model_info))
                     
-                    # Check checkpoint
-                    if self.checkpoint.is_completed(model_url):
-                        stats['skipped'] += 1
-                        if idx % 10 == 0 or idx == len(models):
-                            print(f"  [{idx}/{len(models)}] Skipped (already completed)")
-                        self.logger.debug(f"Skipping already completed URL", url=model_url)
+                    if not pending:
                         continue
                     
-                    # Show progress every 10 models or on last one
-                    if idx % 10 == 0 or idx == len(models):
-                        print(f"  [{idx}/{len(models)}] Processing {make_model}...")
-                    
-                    # Mark as discovered (store category/subcategory context)
-                    self.checkpoint.mark_discovered(model_url)
-                    # Store category/subcategory in checkpoint for resume
-                    checkpoint_data = self.checkpoint.checkpoint_data.get(model_url, {})
-                    checkpoint_data['category'] = category
-                    checkpoint_data['subcategory'] = subcategory
-                    self.checkpoint.checkpoint_data[model_url] = checkpoint_data
-                    self.checkpoint._save_checkpoint()
-                    
-                    try:
-                        # Process model
-                        success = self._process_model(model_url, category, subcategory, model_info)
+                    with self.checkpoint.batch():
+                        for _, model_info in pending:
+                            model_url = model_info['url']
+                            # Mark as discovered (store category/subcategory context)
+                            self.checkpoint.mark_discovered(model_url)
+                            # Store category/subcategory in checkpoint for resume
+                            self.checkpoint.set_context(model_url, category, subcategory)
                         
-                        if success:
-                            stats['saved'] += 1
-                            self.checkpoint.mark_saved(model_url)
-                        else:
-                            stats['failed'] += 1
-                            self.checkpoint.mark_failed(model_url, "Processing failed")
-                    
-                    except Exception as e:
-                        stats['failed'] += 1
-                        self.checkpoint.mark_failed(model_url, str(e))
-                        self.logger.log_parse_error(model_url, str(e))
+                        pages = self._prefetch_model_pages([info['url'] for _, info in pending])
+                        
+                        # Models of a batch are processed concurrently, since each
+                        # one waits on several gallery round trips; the Fetcher
+                        # still spaces requests out according to the rate limit
+                        with ThreadPoolExecutor(max_workers=self.fetcher.max_concurrency) as executor:
+                            jobs = [
+                                executor.submit(self._crawl_model, idx, len(models), model_info,
+                                                html, parse_job, category, subcategory)
+                                for (idx, model_info), (html, parse_job) in zip(pending, pages)
+                            ]
+                        for job in jobs:
+                            stats[job.result()] += 1
         
         except Exception as e:
             self.logger.error("Crawl category failed", error=str(e), 
                             category=category, subcategory=subcategory)
         
+        finally:
+            # Checkpoint writes are debounced; don't leave any behind
+            self.checkpoint.flush()
+        
         stats['parsed'] = stats['saved'] + stats['failed']  # All processed URLs
         
         # Log completeness statistics
@@ -170,6 +257,51 @@ class Crawler:
         
         return stats
     
+    def _crawl_model(self, idx: int, total: int, model_info: Dict, html: Optional[str],
+                     parse_job: Optional[Future], category: str, subcategory: str) -> str:
+        """
+        Process one model of a batch and record the outcome in the checkpoint.
+        
+        Args:
+            idx: 1-based position of the model in the listing (for progress output)
+            total: Number of models in the listing
+            model_info: Model info from listing page
+            html: Prefetched detail page HTML (None if fetching failed)
+            parse_job: Pending parse_model_html result for html
+            category: Category name
+            subcategory: Subcategory name
+            
+        Returns:
+            'saved' or 'failed' (the stats key to count the model under)
+        """
+        model_url = model_info['url']
+        make_model = f"{model_info.get('make', 'unknown')}/{model_info.get('model', 'unknown')}"
+        
+        # Show progress at most once per PROGRESS_EVERY seconds, and on the last one
+        if self._progress_due(idx, total):
+            self.logger.progress(f"  [{idx}/{total}] Processing {make_model}...")
+        
+        if not html:
+            # Fetching already retried; don't fetch the page again
+            self.logger.error("Failed to fetch model page", url=model_url)
+            self.checkpoint.mark_failed(model_url, "Processing failed")
+            return 'failed'
+        
+        try:
+            # Process model
+            success = self._process_model(model_url, category, subcategory, model_info,
+                                          html=html, parse_job=parse_job)
+            
+            if success:
+                self.checkpoint.mark_saved(model_url)
+                return 'saved'
+            self.checkpoint.mark_failed(model_url, "Processing failed")
+        
+        except Exception as e:
+            self.checkpoint.mark_failed(model_url, str(e))
+            self.logger.log_parse_error(model_url, str(e))
+        return 'failed'
+    
     def _discover_all_listing_pages(self, initial_url: str) -> List[str]:
         """
         Discover all listing pages including pagination.
@@ -184,9 +316,13 @@ class Crawler:
         current_url = initial_url
         seen = {initial_url}
         max_pages = 100  # Safety limit
+        prefetched = {}
         
         for _ in range(max_pages):
-            html = self.fetcher.fetch_url_simple(current_url)
+            if current_url in prefetched:
+                html = prefetched.pop(current_url)[0]
+            else:
+                html = self.fetcher.fetch_url_simple(current_url)
             if not html:
                 break
             
@@ -199,6 +335,11 @@ class Crawler:
             seen.add(next_url)
             listing_urls.append(next_url)
             current_url = next_url
+            
+            # Numbered pages may be fetched a few at a time ahead of need;
+            # pages are still followed strictly through next links
+            if next_url not in prefetched:
+                prefetched = prefetch_numbered_pages(self.fetcher, next_url, max_pages - len(listing_urls) + 1)
         
         return listing_urls
     
@@ -223,8 +364,6 @@ class Crawler:
             self.logger.warning("Failed to fetch listing page", url=listing_url)
             return []
         
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'lxml')
         all_models = []
         
         # First, try to find model URLs directly on the listing page
@@ -233,43 +372,69 @@ class Crawler:
             all_models.extend(direct_models)
             self.logger.info(f"Found {len(direct_models)} models directly on listing page", url=listing_url)
         
+        # Dense listings usually link every model already, so when enabled the
+        # make pages are skipped; this is logged since it can miss models
+        threshold = self._make_traversal_threshold
+        if threshold and direct_models and len(direct_models) >= threshold:
+            self.logger.warning("Skipping make pages, listing page links models directly",
+                                url=listing_url,
+                                category=category,
+                                subcategory=subcategory,
+                                direct_models=len(direct_models),
+                                threshold=threshold)
+            return self._dedupe_models(all_models, listing_url)
+        
         # Also extract make links and navigate through them
         # Make links are like /bmw/, /mercedes-benz/ (2 path segments, ends with /)
-        make_links = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            # Make links: /make/ (not /explore/, not model URLs)
-            if (href.startswith('/') and 
-                href.count('/') == 2 and 
-                href.endswith('/') and 
-                not href.startswith('/explore') and
-                not self.parser._is_model_url(href)):
-                full_make_url = f"https://www.netcarshow.com{href}"
-                if full_make_url not in make_links:
-                    make_links.append(full_make_url)
+        make_links = self.discovery.extract_make_urls(html)
         
         self.logger.info(f"Found {len(make_links)} make links on listing page", url=listing_url)
-        print(f"📋 Processing {len(make_links)} make pages... (this may take a few minutes)")
+        self.logger.progress(f"📋 Processing {len(make_links)} make pages... (this may take a few minutes)")
         
         # For each make, fetch the make page and extract models
+        # Make pages are independent, so they are fetched concurrently and each
+        # one is handed to the parse pool as soon as it arrives; make pages
+        # already seen on an earlier listing page reuse their models
+        known = self._make_page_models
+        new_make_links = [url for url in make_links if (url, category, subcategory) not in known]
+        parse_jobs = {}
+        for make_url, make_html, _, _ in self.fetcher.fetch_urls(new_make_links):
+            if make_html:
+                parse_jobs[make_url] = self.parse_pool.submit(parse_listing_html, make_html, category, subcategory)
+        
         for idx, make_url in enumerate(make_links, 1):
+            key = (make_url, category, subcategory)
             try:
-                print(f"  [{idx}/{len(make_links)}] Fetching {make_url.split('/')[-2]}...", end=' ', flush=True)
-                make_html = self.fetcher.fetch_url_simple(make_url)
-                if make_html:
-                    make_models = self.parser.parse_listing_page(make_html, category, subcategory)
+                self.logger.progress(f"  [{idx}/{len(make_links)}] Fetched {make_url.split('/')[-2]}...", end=' ')
+                if key not in known and make_url in parse_jobs:
+                    known[key] = parse_jobs[make_url].result()
+                if key in known:
+                    make_models = known[key]
                     if make_models:
                         all_models.extend(make_models)
-                        print(f"✅ Found {len(make_models)} models")
+                        self.logger.progress(f"✅ Found {len(make_models)} models")
                         self.logger.debug(f"Found {len(make_models)} models from {make_url}")
                     else:
-                        print("✅ (no models)")
+                        self.logger.progress("✅ (no models)")
                 else:
-                    print("⚠️  (failed)")
+                    self.logger.progress("⚠️  (failed)")
             except Exception as e:
-                print(f"⚠️  (error: {str(e)[:50]})")
+                self.logger.progress(f"⚠️  (error: {str(e)[:50]})")
                 self.logger.warning(f"Failed to process make page {make_url}", error=str(e))
         
+        return self._dedupe_models(all_models, listing_url)
+    
+    def _dedupe_models(self, all_models: List[Dict], listing_url: str) -> List[Dict]:
+        """
+        Drop models whose URL was already seen, keeping first occurrences.
+        
+        Args:
+            all_models: Model info dicts found for a listing page
+            listing_url: URL of the listing page (for logging)
+            
+        Returns:
+            List of unique model info dicts
+        """
         # Remove duplicates based on URL
         seen_urls = set()
         unique_models = []
@@ -286,8 +451,31 @@ class Crawler:
         
         return unique_models
     
+    def _prefetch_model_pages(self, model_urls: List[str]) -> List[Tuple[Optional[str], Optional[Future]]]:
+        """
+        Fetch a batch of model detail pages and queue them for parsing.
+        
+        Each page is submitted to the parse pool as soon as it arrives, so
+        parsing overlaps with the rest of the batch downloading.
+        
+        Args:
+            model_urls: Model detail page URLs
+            
+        Returns:
+            List of (html, parse_job) tuples in the order of model_urls;
+            both are None for pages that failed to fetch
+        """
+        pages = []
+        for model_url, html, _, _ in self.fetcher.fetch_urls(model_urls):
+            if html:
+                pages.append((html, self.parse_pool.submit(parse_model_html, html, model_url)))
+            else:
+                pages.append((None, None))
+        return pages
+    
     def _process_model(self, model_url: str, category: str, subcategory: str, 
-                      model_info: Optional[Dict] = None) -> bool:
+                      model_info: Optional[Dict] = None, html: Optional[str] = None,
+                      parse_job: Optional[Future] = None) -> bool:
         """
         Process a single model URL through the full pipeline.
         
@@ -296,20 +484,25 @@ class Crawler:
             category: Category name
             subcategory: Subcategory name
             model_info: Optional model info from listing page
+            html: Already fetched detail page HTML (fetched here if None)
+            parse_job: Pending parse_model_html result for html, if already submitted
             
         Returns:
             True if successfully saved, False otherwise
         """
-        html = None
         try:
             # Fetch detail page
-            html = self.fetcher.fetch_url_simple(model_url)
+            if not html:
+                html = self.fetcher.fetch_url_simple(model_url)
+                parse_job = None
             if not html:
                 self.logger.error("Failed to fetch model page", url=model_url)
                 return False
             
-            # Parse detail page
-            parsed_data = self.parser.parse_model_detail_page(html, model_url)
+            # Parse detail page and trims/specs in the parse pool
+            if parse_job is None:
+                parse_job = self.parse_pool.submit(parse_model_html, html, model_url)
+            parsed_data, trims = parse_job.result()
             if not parsed_data or not parsed_data.get('make') or not parsed_data.get('model'):
                 self.logger.error("Failed to parse model page or missing required fields", url=model_url)
                 # Save HTML for debugging
@@ -324,8 +517,6 @@ class Crawler:
                                      make=parsed_data.get('make'),
                                      model=parsed_data.get('model'))
             
-            # Parse trims and specs
-            trims = self.parser.parse_trims_and_specs(html)
             parsed_data['trims'] = trims
             
             # Determine normalized identifiers for gallery filtering
@@ -338,23 +529,28 @@ class Crawler:
                 year_for_filter = str(parsed_data.get('years')[0])
             
             if make_for_filter and model_for_filter:
-                from .schema import SchemaMapper
                 make_for_filter = SchemaMapper._normalize_name(make_for_filter)
                 model_for_filter = SchemaMapper._normalize_name(model_for_filter)
             
-            detail_gallery_images = self.gallery_parser.extract_images_from_detail(
-                html,
-                page_url=model_url,
-                fetcher=self.fetcher,
-                year=year_for_filter
-            )
-            
-            # Fetch and parse gallery
+            # Fetch and parse gallery; the gallery page downloads while the
+            # inline gallery of the detail page (and its own JSON lookup) is
+            # extracted
             gallery_url = parsed_data.get('gallery_url')
             images = []
             
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                gallery_fetch = executor.submit(self.fetcher.fetch_url_simple, gallery_url) if gallery_url else None
+                
+                detail_gallery_images = self.gallery_parser.extract_images_from_detail(
+                    html,
+                    page_url=model_url,
+                    fetcher=self.fetcher,
+                    year=year_for_filter
+                )
+                
+                gallery_html = gallery_fetch.result() if gallery_fetch else None
+            
             if gallery_url:
-                gallery_html = self.fetcher.fetch_url_simple(gallery_url)
                 if gallery_html:
                     images = self.gallery_parser.parse_all_gallery_pages(
                         gallery_html, gallery_url, self.fetcher,
@@ -367,9 +563,8 @@ class Crawler:
             
             if images:
                 if detail_gallery_images:
-                    for img_url in detail_gallery_images:
-                        if img_url not in images:
-                            images.append(img_url)
+                    # Order-preserving merge in one pass (first occurrence wins)
+                    images = list(dict.fromkeys(images + detail_gallery_images))
             else:
                 images = detail_gallery_images
             
@@ -437,7 +632,7 @@ class Crawler:
         }
         
         # Discover all categories
-        categories = self.discovery.discover_main_categories()
+        categories = self._get_categories()
         self.logger.info(f"Found {len(categories)} main categories")
         
         for category_info in categories:
@@ -445,7 +640,7 @@ class Crawler:
             category_url = category_info['url']
             
             # Discover subcategories
-            subcategories = self.discovery.discover_subcategories(category_url)
+            subcategories = self._get_subcategories(category_url)
             self.logger.info(f"Found {len(subcategories)} subcategories for {category}")
             
             for subcat_info in subcategories:
@@ -496,9 +691,9 @@ class Crawler:
             
             try:
                 # Get category/subcategory from checkpoint if stored
-                checkpoint_data = self.checkpoint.checkpoint_data.get(url, {})
-                category = checkpoint_data.get('category', 'Unknown')
-                subcategory = checkpoint_data.get('subcategory', 'Unknown')
+                record = self.checkpoint.get_record(url) or {}
+                category = record.get('category', 'Unknown')
+                subcategory = record.get('subcategory', 'Unknown')
                 
                 # Process the URL
                 success = self._process_model(url, category, subcategory)
@@ -514,6 +709,8 @@ class Crawler:
                 self.checkpoint.mark_failed(url, str(e))
                 self.logger.log_parse_error(url, str(e))
         
+        self.checkpoint.flush()
+        
         stats['parsed'] = stats['saved'] + stats['failed']
         self.logger.log_crawl_complete(stats)
         
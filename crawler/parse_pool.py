@@ -0,0 +1,126 @@
+"""
+Process pool for CPU-bound HTML parsing, decoupled from fetching.
+"""
+
+import atexit
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    from .parser import Parser
+except ImportError:  # run directly as a script
+    from parser import Parser
+
+
+# One Parser per worker process, created on first use
+_parser: Optional[Parser] = None
+
+
+def _get_parser() -> Parser:
+    global _parser
+    if _parser is None:
+        _parser = Parser()
+    return _parser
+
+
+def parse_listing_html(html: str, category: str = "", subcategory: str = "") -> List[Dict[str, str]]:
+    """Parse a listing or make page into model info dicts (runs in a worker)."""
+    return _get_parser().parse_listing_page(html, category, subcategory)
+
+
+def parse_model_html(html: str, url: str) -> Tuple[Dict, Optional[List[Dict]]]:
+    """
+    Parse a model detail page and its trims/specs (runs in a worker).
+    
+    Args:
+        html: HTML content of the detail page
+        url: URL of the detail page
+    
+    Returns:
+        Tuple of (parsed_data, trims); trims is None if the page is missing
+        make or model, since such pages are discarded
+    """
+    if not html:
+        return {}, None
+    parser = _get_parser()
+    # Neither parse step modifies the soup, so the page is parsed once for both
+    soup = BeautifulSoup(html, 'lxml')
+    parsed_data = parser.parse_model_detail_page(html, url, soup=soup)
+    if not parsed_data or not parsed_data.get('make') or not parsed_data.get('model'):
+        return parsed_data, None
+    return parsed_data, parser.parse_trims_and_specs(html, soup=soup)
+
+
+class ParsePool:
+    """Runs parse functions in worker processes so parsing overlaps with network I/O."""
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize parse pool.
+        
+        Args:
+            max_workers: Number of worker processes (default: CPU count);
+                1 or less parses inline in the calling process
+        """
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        atexit.register(self.close)
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Start the worker processes on first use (None when parsing inline)."""
+        if self._executor is None and self.max_workers > 1:
+            try:
+                # The crawler is multi-threaded by the time parsing starts, so
+                # workers are not forked from it directly (a fork can copy
+                # locks held by other threads); forkserver/spawn start them
+                # from a clean process instead. Those re-import __main__, so
+                # the default is kept when it is not a real file (stdin, REPL)
+                context = None
+                main_file = getattr(sys.modules.get('__main__'), '__file__', None)
+                if main_file and os.path.isfile(main_file):
+                    methods = multiprocessing.get_all_start_methods()
+                    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            except (OSError, NotImplementedError):
+                # Platforms without working multiprocessing parse inline
+                self.max_workers = 1
+        return self._executor
+    
+    def submit(self, fn: Callable, *args) -> Future:
+        """
+        Schedule fn(*args) on a worker process.
+        
+        Args:
+            fn: Module-level (picklable) parse function
+            args: Picklable arguments
+        
+        Returns:
+            Future holding the result; already resolved when parsing inline
+        """
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                return executor.submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died; drop the pool and parse inline from now on
+                self.close()
+                self.max_workers = 1
+        
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
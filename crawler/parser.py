@@ -2,11 +2,71 @@
 Parser for extracting vehicle data from NetCarShow HTML pages.
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 import re
 
+try:
+    from .html_tree import parse_html
+    from .schema import SchemaMapper
+except ImportError:  # run directly as a script
+    from html_tree import parse_html
+    from schema import SchemaMapper
+
+
+# Model path: /{make}/{year}-{model}/ or /{make}/{model}/ (slashes around it optional)
+_MODEL_PATH_RE = re.compile(r'^/*([^/]+)/(?:(\d{4})-([^/]*)|([^/]+))/*$')
+
+# Model link href: /{make}/{year-model} where year-model starts with a digit
+# and contains a dash, optionally followed by slashes
+_MODEL_HREF_RE = re.compile(r'/[^/]*/\d[^/]*-[^/]*/*')
+
+# Listing pages are only scanned for link targets, read straight from lxml
+_HREFS_XPATH = etree.XPath('//a/@href', smart_strings=False)
+
+# The pagination scan only looks at these tags, so the rest of the page is
+# not built into BeautifulSoup objects
+_LINKS_AND_CONTAINERS = SoupStrainer(['a', 'nav', 'div'])
+
+# Patterns used by the detail, spec and pagination parsers, compiled once
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_REVIEW_RE = re.compile(r'review', re.I)
+_REVIEW_OR_EXPERT_RE = re.compile(r'review|expert', re.I)
+# Preference of a tag whose class matches _REVIEW_RE (see _extract_expert_review)
+_REVIEW_CLASS_PRIORITY = {'div': 0, 'section': 2, 'article': 4}
+_CONTENT_OR_MAIN_RE = re.compile(r'content|main', re.I)
+# Words that mark text as navigation or boilerplate rather than content
+_REVIEW_SKIP_RE = re.compile(r'home|menu|navigation|cookie|privacy', re.I)
+_LIST_ITEM_SKIP_RE = re.compile(r'show more|read more|next|previous|home', re.I)
+# Words suggesting a paragraph is a review (car features, driving, etc.)
+_REVIEW_INDICATOR_RE = re.compile(r'engine|power|drive|handling|interior|exterior|performance', re.I)
+_TITLE_YEAR_RE = re.compile(r'\s*\(\d{4}\)\s*')
+_PICTURES_SUFFIX_RE = re.compile(r'\s*-\s*pictures.*$', re.I)
+_INFORMATION_SUFFIX_RE = re.compile(r'\s*-\s*information.*$', re.I)
+_SPEC_OR_TRIM_RE = re.compile(r'spec|trim', re.I)
+# Preference of a tag whose class matches _SPEC_OR_TRIM_RE (see _find_spec_sections)
+_SPEC_CLASS_PRIORITY = {'table': 0, 'div': 1, 'section': 2}
+_SPEC_KEYWORD_RE = re.compile(r'engine|power|torque|transmission|fuel|safety|weight', re.I)
+_SPEC_CATEGORY_KEYWORD_RE = re.compile(
+    r'features|highlights|engine|suspension|safety|entertainment|electrical|brakes|weight|capacity', re.I)
+_PRICE_RE = re.compile(r'\$[\d,]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_BULLET_RE = re.compile(r'\s*[•·]\s*')
+_SEAT_RE = re.compile(r'(\d+[-\s]?seat)', re.I)
+_DRIVETRAIN_RE = re.compile(r'(front[-\s]?wheel\s+drive|rear[-\s]?wheel\s+drive|all[-\s]?wheel\s+drive|4matric|awd|fwd|rwd)', re.I)
+# "XXX-horsepower (SAE net), X.X-liter, ... engine"
+_ENGINE_PROSE_RE = re.compile(r'(\d+)[-\s]?(horsepower|hp)\s*\([^)]*\)[,\s]+(\d+\.\d+)[-\s]?(liter|l|litre)[,\s]+([^,]+?)(?:engine|mated)', re.I)
+_FOUR_CYLINDER_RE = re.compile(r'(inline|i[-\s]?4|four[-\s]?cylinder)', re.I)
+_V6_RE = re.compile(r'v6|six[-\s]?cylinder', re.I)
+_V8_RE = re.compile(r'v8|eight[-\s]?cylinder', re.I)
+_V12_RE = re.compile(r'v12|twelve[-\s]?cylinder', re.I)
+_DECIMAL_RE = re.compile(r'\d+\.\d+')
+_NUMBER_RE = re.compile(r'\d+[,\.]?\d*')
+_PAGINATION_RE = re.compile(r'paginat', re.I)
+_NEXT_LINK_RE = re.compile(r'next|>', re.I)
+
 
 class Parser:
     """Handles parsing of listing pages, detail pages, and specifications."""
@@ -32,34 +92,23 @@ class Parser:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
+        doc = parse_html(html)
+        if doc is None:
+            return []
         models = []
         seen = set()
         
+        # Potential model links in DOM, counted for the completeness check
+        potential_model_links = 0
+        
         # Find all links to model detail pages
         # Pattern: /{make}/{year}-{model}/
-        all_links = soup.find_all('a', href=True)
-        
-        # Count potential model links in DOM for completeness check
-        potential_model_links = 0
-        for link in all_links:
-            href = link.get('href', '')
+        for href in _HREFS_XPATH(doc):
+            # Model URLs have pattern: /make/year-model/ (not ending in -wallpapers or /)
             if href and self._is_model_url(href):
                 potential_model_links += 1
-        
-        for link in all_links:
-            href = link.get('href', '')
-            if not href:
-                continue
-            
-            # Convert relative URLs to absolute
-            if href.startswith('/'):
+                # Model URLs are site-relative; convert to absolute
                 full_url = urljoin(self.base_url, href)
-            else:
-                full_url = href
-            
-            # Model URLs have pattern: /make/year-model/ (not ending in -wallpapers or /)
-            if self._is_model_url(href):
                 if full_url not in seen:
                     seen.add(full_url)
                     
@@ -68,7 +117,6 @@ class Parser:
                     
                     if make and model:
                         # Normalize model name for consistency
-                        from .schema import SchemaMapper
                         normalized_model = SchemaMapper._normalize_name(model)
                         
                         models.append({
@@ -90,32 +138,13 @@ class Parser:
     
     def _is_model_url(self, href: str) -> bool:
         """Check if href is a model detail page URL."""
-        if not href.startswith('/'):
-            return False
-        
-        # Exclude gallery pages
-        if '-wallpapers' in href:
-            return False
-        
-        # Pattern: /make/year-model/ (trailing slash is OK)
-        # Strip trailing slash for parsing, but allow it
-        href_clean = href.rstrip('/')
-        parts = href_clean.split('/')
-        
-        # Should have exactly 2 parts: ['', 'make', 'year-model']
-        if len(parts) != 3:
+        # Only site-relative links; exclude gallery pages
+        if not href.startswith('/') or '-wallpapers' in href:
             return False
         
-        # Second part is make, third part is year-model
-        if len(parts) < 3:
-            return False
-        
-        # Third part should have year-model pattern (year starts with digit, has dash)
-        model_part = parts[2] if len(parts) > 2 else ''
-        if '-' in model_part and model_part[0].isdigit():
-            return True
-        
-        return False
+        # Pattern: /make/year-model/ (trailing slash is OK); one regex match
+        # instead of splitting every anchor's href into a list
+        return _MODEL_HREF_RE.fullmatch(href) is not None
     
     def _parse_model_url(self, href: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
@@ -127,29 +156,25 @@ class Parser:
         Returns:
             Tuple of (make, year, model)
         """
-        parts = href.strip('/').split('/')
-        if len(parts) != 2:
+        match = _MODEL_PATH_RE.match(href)
+        if not match:
             return None, None, None
         
-        make = parts[0].replace('-', '_')
-        year_model = parts[1]
+        make, year, model, model_without_year = match.groups()
+        make = make.replace('-', '_')
+        if year is not None:
+            return make, year, model.replace('-', '_')
         
-        # Extract year (first 4 digits)
-        year_match = re.match(r'^(\d{4})-', year_model)
-        if year_match:
-            year = year_match.group(1)
-            model = year_model[len(year) + 1:].replace('-', '_')
-            return make, year, model
-        
-        return make, None, year_model.replace('-', '_')
+        return make, None, model_without_year.replace('-', '_')
     
-    def parse_model_detail_page(self, html: str, url: str) -> Dict:
+    def parse_model_detail_page(self, html: str, url: str, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Parse a model detail page to extract vehicle information.
         
         Args:
             html: HTML content of the detail page
             url: URL of the detail page
+            soup: BeautifulSoup of html, if the caller has already parsed it
             
         Returns:
             Dict with make, model, years, expert_review, gallery_url, etc.
@@ -157,7 +182,8 @@ class Parser:
         if not html:
             return {}
         
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
         
         # Extract make, year, model from URL
         make, year, model = self._parse_model_url(urlparse(url).path)
@@ -204,44 +230,44 @@ class Parser:
         
         # If no year in URL, try to extract from page title/heading (but only one)
         # Look for year in h1 or title tag
+        # (_YEAR_RE only matches 19xx/20xx, so the first match is a valid year)
         for element in soup.find_all(['h1', 'title']):
-            text = element.get_text()
-            year_matches = re.findall(r'\b(19\d{2}|20\d{2})\b', text)
-            if year_matches:
-                try:
-                    year = int(year_matches[0])
-                    if 1900 <= year <= 2100:
-                        return [str(year)]
-                except ValueError:
-                    pass
+            year_match = _YEAR_RE.search(element.get_text())
+            if year_match:
+                return [year_match.group(1)]
         
         # Return empty if no year found - will be handled by schema mapper
         return []
     
     def _extract_expert_review(self, soup: BeautifulSoup) -> str:
         """Extract expert review text from the page."""
-        # Look for review sections - common patterns
-        review_selectors = [
-            ('div', {'class': re.compile(r'review', re.I)}),
-            ('div', {'id': re.compile(r'review', re.I)}),
-            ('section', {'class': re.compile(r'review', re.I)}),
-            ('p', {'class': re.compile(r'review|expert', re.I)}),
-            ('article', {'class': re.compile(r'review', re.I)}),
-        ]
+        # Look for review sections - common patterns, in order of preference:
+        # div.review, div#review, section.review, p.review|expert, article.review
+        # (candidates for all of them are collected in one walk of the tree)
+        review_candidates = ([], [], [], [], [])
+        for elem in soup.find_all(['div', 'section', 'p', 'article']):
+            classes = ' '.join(elem.get('class') or ())
+            if elem.name == 'p':
+                if _REVIEW_OR_EXPERT_RE.search(classes):
+                    review_candidates[3].append(elem)
+                continue
+            if _REVIEW_RE.search(classes):
+                review_candidates[_REVIEW_CLASS_PRIORITY[elem.name]].append(elem)
+            if elem.name == 'div' and _REVIEW_RE.search(elem.get('id') or ''):
+                review_candidates[1].append(elem)
         
-        for tag, attrs in review_selectors:
-            elements = soup.find_all(tag, attrs)
+        for elements in review_candidates:
             for elem in elements:
                 text = elem.get_text().strip()
                 # Filter out very short or very long text (likely not a review)
                 if 100 < len(text) < 50000:  # Reasonable review length
                     # Make sure it's not just navigation or metadata
-                    if not any(skip in text.lower()[:100] for skip in ['home', 'menu', 'navigation', 'cookie', 'privacy']):
+                    if not _REVIEW_SKIP_RE.search(text, 0, 100):
                         return text
         
         # Fallback: look for long paragraphs in main content area
         # But exclude headers, footers, navigation
-        main_content = soup.find('main') or soup.find('article') or soup.find('div', {'class': re.compile(r'content|main', re.I)})
+        main_content = soup.find('main') or soup.find('article') or soup.find('div', {'class': _CONTENT_OR_MAIN_RE})
         if main_content:
             paragraphs = main_content.find_all('p')
             for p in paragraphs:
@@ -254,8 +280,7 @@ class Parser:
         for p in paragraphs:
             text = p.get_text().strip()
             # Check if it looks like a review (mentions car features, driving, etc.)
-            review_indicators = ['engine', 'power', 'drive', 'handling', 'interior', 'exterior', 'performance']
-            if 200 < len(text) < 50000 and any(indicator in text.lower() for indicator in review_indicators):
+            if 200 < len(text) < 50000 and _REVIEW_INDICATOR_RE.search(text):
                 return text
         
         return ""
@@ -326,9 +351,9 @@ class Parser:
         if h1:
             text = h1.get_text().strip()
             # Remove year and extra text
-            text = re.sub(r'\s*\(\d{4}\)\s*', '', text)  # Remove (2024)
-            text = re.sub(r'\s*-\s*pictures.*$', '', text, flags=re.I)  # Remove "- pictures..."
-            text = re.sub(r'\s*-\s*information.*$', '', text, flags=re.I)  # Remove "- information..."
+            text = _TITLE_YEAR_RE.sub('', text)  # Remove (2024)
+            text = _PICTURES_SUFFIX_RE.sub('', text)  # Remove "- pictures..."
+            text = _INFORMATION_SUFFIX_RE.sub('', text)  # Remove "- information..."
             if text and len(text) < 50:  # Reasonable model name length
                 return text
         
@@ -351,12 +376,13 @@ class Parser:
         
         return ""
     
-    def parse_trims_and_specs(self, html: str) -> List[Dict]:
+    def parse_trims_and_specs(self, html: str, soup: Optional[BeautifulSoup] = None) -> List[Dict]:
         """
         Parse trim and specification information from a detail page.
         
         Args:
             html: HTML content of the detail page
+            soup: BeautifulSoup of html, if the caller has already parsed it
             
         Returns:
             List of trim dicts with 'name', 'price', 'specifications'
@@ -364,7 +390,8 @@ class Parser:
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
+        if soup is None:
+            soup = BeautifulSoup(html, 'lxml')
         trims = []
         
         # Look for trim/specification sections
@@ -399,34 +426,24 @@ class Parser:
     
     def _find_spec_sections(self, soup: BeautifulSoup) -> List:
         """Find specification sections in the HTML."""
-        sections = []
-        
-        # Look for common spec section patterns
-        selectors = [
-            ('table', {'class': re.compile(r'spec|trim', re.I)}),
-            ('div', {'class': re.compile(r'spec|trim', re.I)}),
-            ('section', {'class': re.compile(r'spec|trim', re.I)}),
-            ('div', {'id': re.compile(r'spec|trim', re.I)}),
-        ]
-        
-        for tag, attrs in selectors:
-            found = soup.find_all(tag, attrs)
-            sections.extend(found)
-        
-        # Also look for tables that might contain specs
-        tables = soup.find_all('table')
-        for table in tables:
-            # Check if table looks like a spec table
-            if self._looks_like_spec_table(table):
-                sections.append(table)
-        
-        return sections
+        # Look for common spec section patterns, in this order: table.spec|trim,
+        # div.spec|trim, section.spec|trim, div#spec|trim, then any table that
+        # looks like a spec table (matches for all are collected in one walk)
+        groups = ([], [], [], [], [])
+        for elem in soup.find_all(['table', 'div', 'section']):
+            if _SPEC_OR_TRIM_RE.search(' '.join(elem.get('class') or ())):
+                groups[_SPEC_CLASS_PRIORITY[elem.name]].append(elem)
+            if elem.name == 'div':
+                if _SPEC_OR_TRIM_RE.search(elem.get('id') or ''):
+                    groups[3].append(elem)
+            elif elem.name == 'table' and self._looks_like_spec_table(elem):
+                groups[4].append(elem)
+        
+        return [section for group in groups for section in group]
     
     def _looks_like_spec_table(self, table) -> bool:
         """Check if a table looks like a specifications table."""
-        text = table.get_text().lower()
-        spec_keywords = ['engine', 'power', 'torque', 'transmission', 'fuel', 'safety', 'weight']
-        return any(keyword in text for keyword in spec_keywords)
+        return _SPEC_KEYWORD_RE.search(table.get_text()) is not None
     
     def _parse_trim_section(self, section) -> Optional[Dict]:
         """Parse a single trim/specification section."""
@@ -443,9 +460,9 @@ class Parser:
                 trim_name = heading_text
         
         # Try to extract price
-        price_elem = section.find(string=re.compile(r'\$[\d,]+'))
+        price_elem = section.find(string=_PRICE_RE)
         if price_elem:
-            price_match = re.search(r'\$[\d,]+', price_elem)
+            price_match = _PRICE_RE.search(price_elem)
             if price_match:
                 price = price_match.group(0)
         
@@ -541,21 +558,26 @@ class Parser:
         specs = {}
         current_category = None
         
+        # Headings and lists are both collected in one walk of the section
+        headings = []
+        lists = []
+        for elem in section.find_all(['h2', 'h3', 'h4', 'h5', 'strong', 'b', 'ul', 'ol', 'dl']):
+            if elem.name in ('ul', 'ol', 'dl'):
+                lists.append(elem)
+            else:
+                headings.append(elem)
+        
         # Look for category headers first (h2, h3, h4, strong headings before lists)
-        headings = section.find_all(['h2', 'h3', 'h4', 'h5', 'strong', 'b'])
         for heading in headings:
             text = heading.get_text().strip()
             if text and len(text) < 100:
                 # Check if this looks like a category name
-                category_keywords = ['features', 'highlights', 'engine', 'suspension', 'safety', 
-                                   'entertainment', 'electrical', 'brakes', 'weight', 'capacity']
-                if any(keyword in text.lower() for keyword in category_keywords) or len(text.split()) <= 3:
+                if _SPEC_CATEGORY_KEYWORD_RE.search(text) or len(text.split()) <= 3:
                     current_category = text
                     if current_category not in specs:
                         specs[current_category] = []
         
         # Look for lists
-        lists = section.find_all(['ul', 'ol', 'dl'])
         for list_elem in lists:
             # Check if there's a heading right before this list
             prev_sibling = list_elem.find_previous_sibling(['h2', 'h3', 'h4', 'h5', 'strong', 'b', 'p'])
@@ -607,7 +629,7 @@ class Parser:
         specs = {}
         
         # Find main content area
-        main_content = soup.find('div', class_='a-b') or soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile(r'content|main', re.I))
+        main_content = soup.find('div', class_='a-b') or soup.find('main') or soup.find('article') or soup.find('div', class_=_CONTENT_OR_MAIN_RE)
         if not main_content:
             return specs
         
@@ -714,15 +736,15 @@ class Parser:
                     continue
                 
                 # Skip items that are clearly navigation or metadata
-                if any(skip in text.lower()[:50] for skip in ['show more', 'read more', 'next', 'previous', 'home']):
+                if _LIST_ITEM_SKIP_RE.search(text, 0, 50):
                     continue
                 
                 # Determine category for this item
                 item_category = category or self._infer_category_from_label(text) or 'Notable features'
                 
                 # Clean up the text
-                text = re.sub(r'\s+', ' ', text)
-                text = re.sub(r'\s*[•·]\s*', '', text)  # Remove bullet characters
+                text = _WHITESPACE_RE.sub(' ', text)
+                text = _BULLET_RE.sub('', text)  # Remove bullet characters
                 
                 # Add to specs
                 self._add_spec_entry(specs, item_category, text)
@@ -732,7 +754,7 @@ class Parser:
     def _normalize_spec_text(self, text: str) -> str:
         if not text:
             return ''
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         return text.strip()
 
     def _add_spec_entry(self, specs: Dict[str, List[str]], category: str, value: str):
@@ -914,12 +936,12 @@ class Parser:
                     highlights.append(highlight)
         
         # Seat capacity
-        seat_match = re.search(r'(\d+[-\s]?seat)', text, re.I)
+        seat_match = _SEAT_RE.search(text)
         if seat_match:
             highlights.append(f"{seat_match.group(1)} capacity")
         
         # Drivetrain
-        drivetrain_match = re.search(r'(front[-\s]?wheel\s+drive|rear[-\s]?wheel\s+drive|all[-\s]?wheel\s+drive|4matric|awd|fwd|rwd)', text, re.I)
+        drivetrain_match = _DRIVETRAIN_RE.search(text)
         if drivetrain_match:
             highlights.append(f"{drivetrain_match.group(1).title()} Drivetrain")
         
@@ -931,8 +953,7 @@ class Parser:
         
         # FIRST: Try to extract from prose patterns (most reliable for NetCarShow.com)
         # Pattern: "XXX-horsepower (SAE net), X.X-liter, ..."
-        prose_pattern = r'(\d+)[-\s]?(horsepower|hp)\s*\([^)]*\)[,\s]+(\d+\.\d+)[-\s]?(liter|l|litre)[,\s]+([^,]+?)(?:engine|mated)'
-        prose_match = re.search(prose_pattern, text, re.I)
+        prose_match = _ENGINE_PROSE_RE.search(text)
         if prose_match:
             hp = prose_match.group(1)
             displacement = prose_match.group(3)
@@ -943,13 +964,13 @@ class Parser:
             if hp.isdigit() and int(hp) >= 50:
                 # Try to extract engine type from details
                 engine_type = None
-                if re.search(r'(inline|i[-\s]?4|four[-\s]?cylinder)', details, re.I):
+                if _FOUR_CYLINDER_RE.search(details):
                     engine_type = "I-4"
-                elif re.search(r'v6|six[-\s]?cylinder', details, re.I):
+                elif _V6_RE.search(details):
                     engine_type = "V6"
-                elif re.search(r'v8|eight[-\s]?cylinder', details, re.I):
+                elif _V8_RE.search(details):
                     engine_type = "V8"
-                elif re.search(r'v12|twelve[-\s]?cylinder', details, re.I):
+                elif _V12_RE.search(details):
                     engine_type = "V12"
                 
                 if engine_type:
@@ -1052,8 +1073,7 @@ class Parser:
         # NetCarShow.com often has patterns like "201-horsepower (SAE net), 2.4-liter, 16-valve DOHC i-VTEC™ engine"
         if not engine_specs:
             # Pattern: "XXX-horsepower (SAE net), X.X-liter, ..."
-            prose_pattern = r'(\d+)[-\s]?(horsepower|hp)\s*\([^)]*\)[,\s]+(\d+\.\d+)[-\s]?(liter|l|litre)[,\s]+([^,]+?)(?:engine|mated)'
-            prose_match = re.search(prose_pattern, text, re.I)
+            prose_match = _ENGINE_PROSE_RE.search(text)
             if prose_match:
                 hp = prose_match.group(1)
                 displacement = prose_match.group(3)
@@ -1062,13 +1082,13 @@ class Parser:
                 
                 # Try to extract engine type from details
                 engine_type = None
-                if re.search(r'(inline|i[-\s]?4|four[-\s]?cylinder)', details, re.I):
+                if _FOUR_CYLINDER_RE.search(details):
                     engine_type = "I-4"
-                elif re.search(r'v6|six[-\s]?cylinder', details, re.I):
+                elif _V6_RE.search(details):
                     engine_type = "V6"
-                elif re.search(r'v8|eight[-\s]?cylinder', details, re.I):
+                elif _V8_RE.search(details):
                     engine_type = "V8"
-                elif re.search(r'v12|twelve[-\s]?cylinder', details, re.I):
+                elif _V12_RE.search(details):
                     engine_type = "V12"
                 
                 if engine_type:
@@ -1100,7 +1120,7 @@ class Parser:
                                     engine_specs.append(f"{hp_val} @ SAE Net Horsepower @ RPM")
                             if any('liter' in p.lower() or 'l' == p.lower() for p in parts):
                                 # Has displacement
-                                disp_val = next((p for p in parts if re.match(r'\d+\.\d+', p)), None)
+                                disp_val = next((p for p in parts if _DECIMAL_RE.match(p)), None)
                                 if disp_val:
                                     engine_specs.append(f"{disp_val} L Displacement")
         
@@ -1183,7 +1203,7 @@ class Parser:
                         weight_val = None
                         weight_unit = None
                         for part in parts:
-                            if re.match(r'\d+[,\.]?\d*', part):
+                            if _NUMBER_RE.match(part):
                                 weight_val = part.replace(',', '')
                             elif part.lower() in ['lb', 'lbs', 'kg', 'kilograms']:
                                 weight_unit = part
@@ -1234,7 +1254,7 @@ class Parser:
                         dim_unit = None
                         dim_type = None
                         for part in parts:
-                            if re.match(r'\d+[,\.]?\d*', part):
+                            if _NUMBER_RE.match(part):
                                 dim_val = part
                             elif part.lower() in ['mm', 'millimetres', 'millimeters', 'in', 'inch', 'inches', '"']:
                                 dim_unit = part if part != '"' else 'in'
@@ -1460,7 +1480,7 @@ class Parser:
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'lxml')
+        soup = BeautifulSoup(html, 'lxml', parse_only=_LINKS_AND_CONTAINERS)
         
         # Look for "SHOW MORE" or "Next" links
         next_keywords = ['show more', 'next', 'more', 'load more']
@@ -1476,9 +1496,9 @@ class Parser:
                     return href
         
         # Look for pagination links
-        pagination = soup.find(['nav', 'div'], class_=re.compile(r'paginat', re.I))
+        pagination = soup.find(['nav', 'div'], class_=_PAGINATION_RE)
         if pagination:
-            next_link = pagination.find('a', string=re.compile(r'next|>', re.I))
+            next_link = pagination.find('a', string=_NEXT_LINK_RE)
             if next_link and next_link.get('href'):
                 href = next_link.get('href')
                 if href.startswith('/'):
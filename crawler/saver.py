@@ -2,11 +2,13 @@
 File saving and organization for crawled vehicle data.
 """
 
-import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Optional
+from . import fastjson
 from .schema import SchemaMapper
+from .validator import Validator
 
 
 class Saver:
@@ -21,6 +23,9 @@ class Saver:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Records of different years share a file, so the load/merge/write
+        # sequence is serialized when models are saved from several threads
+        self._lock = threading.Lock()
     
     def save_record(self, record: Dict, category: str, subcategory: str, 
                    make: Optional[str] = None, model: Optional[str] = None) -> str:
@@ -63,26 +68,26 @@ class Saver:
         model_filename = model.replace('/', '_').replace('\\', '_')
         file_path = os.path.join(dir_path, f"{model_filename}.json")
         
-        # Check if file exists and merge years if needed
-        if os.path.exists(file_path):
-            existing_record = self._load_existing_record(file_path)
-            if existing_record:
-                record = SchemaMapper.merge_years(existing_record, record)
-        
-        # Validate record before saving
-        from .validator import Validator
-        is_valid, errors = Validator.validate_record(record)
-        
-        if not is_valid:
-            raise ValueError(f"Record validation failed: {errors}")
-        
-        # Save to file
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(record, f, indent=2, ensure_ascii=False)
-            return file_path
-        except IOError as e:
-            raise IOError(f"Failed to save record to {file_path}: {e}")
+        with self._lock:
+            # Check if file exists and merge years if needed
+            if os.path.exists(file_path):
+                existing_record = self._load_existing_record(file_path)
+                if existing_record:
+                    record = SchemaMapper.merge_years(existing_record, record)
+            
+            # Validate record before saving
+            is_valid, errors = Validator.validate_record(record)
+            
+            if not is_valid:
+                raise ValueError(f"Record validation failed: {errors}")
+            
+            # Save to file
+            try:
+                with open(file_path, 'wb') as f:
+                    f.write(fastjson.dumps(record, indent=True))
+                return file_path
+            except IOError as e:
+                raise IOError(f"Failed to save record to {file_path}: {e}")
     
     def _load_existing_record(self, file_path: str) -> Optional[Dict]:
         """
@@ -98,9 +103,9 @@ class Saver:
             return None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(file_path, 'rb') as f:
+                return fastjson.loads(f.read())
+        except (fastjson.JSONDecodeError, IOError):
             return None
     
     def merge_years(self, existing_record: Dict, new_record: Dict) -> Dict:
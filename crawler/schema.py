@@ -2,10 +2,27 @@
 Schema mapping to transform parsed data into the reference schema format.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse
 import re
 
 
+# Name normalization patterns, compiled once rather than looked up in re's
+# internal cache on every call
+SEPARATOR_REGEX = re.compile(r'[\s\-]+')
+NON_NAME_CHAR_REGEX = re.compile(r'[^a-z0-9_]')
+UNDERSCORE_RUN_REGEX = re.compile(r'_+')
+
+# Common make name variations (only applied to exact matches, so that
+# "bmw_x5" does not become just "bmw")
+MAKE_VARIATIONS = {
+    'mercedes': 'mercedes_benz',
+    'mercedesbenz': 'mercedes_benz',
+    'mb': 'mercedes_benz',
+}
+
+
 class SchemaMapper:
     """Maps scraped data to the reference schema format."""
     
@@ -50,7 +67,6 @@ class SchemaMapper:
         if ' - ' in model_to_normalize or 'pictures' in model_to_normalize.lower() or 'information' in model_to_normalize.lower():
             # Try to extract from URL if available
             if 'url' in scraped_data:
-                from urllib.parse import urlparse
                 path = urlparse(scraped_data['url']).path
                 parts = path.strip('/').split('/')
                 if len(parts) >= 2:
@@ -166,6 +182,7 @@ class SchemaMapper:
         }
     
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _normalize_name(name: str) -> str:
         """
         Normalize make/model name to reference format.
@@ -189,30 +206,19 @@ class SchemaMapper:
         normalized = name.lower().strip()
         
         # Replace spaces and hyphens with underscores
-        normalized = re.sub(r'[\s\-]+', '_', normalized)
+        normalized = SEPARATOR_REGEX.sub('_', normalized)
         
         # Remove special characters (keep alphanumeric and underscores)
-        normalized = re.sub(r'[^a-z0-9_]', '', normalized)
+        normalized = NON_NAME_CHAR_REGEX.sub('', normalized)
         
         # Remove multiple consecutive underscores
-        normalized = re.sub(r'_+', '_', normalized)
+        normalized = UNDERSCORE_RUN_REGEX.sub('_', normalized)
         
         # Remove leading/trailing underscores
         normalized = normalized.strip('_')
         
         # Handle common make name variations (only for exact matches)
-        # This prevents "bmw_x5" from becoming just "bmw"
-        make_variations = {
-            'mercedes': 'mercedes_benz',
-            'mercedesbenz': 'mercedes_benz',
-            'mb': 'mercedes_benz',
-        }
-        
-        # Only apply variations for exact matches (not partial matches)
-        if normalized in make_variations:
-            normalized = make_variations[normalized]
-        
-        return normalized
+        return MAKE_VARIATIONS.get(normalized, normalized)
     
     @staticmethod
     def merge_years(existing_record: Dict, new_record: Dict) -> Dict:
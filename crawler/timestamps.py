@@ -0,0 +1,41 @@
+"""
+ISO timestamp formatting shared by the checkpoint and the logger.
+"""
+
+import functools
+import math
+from datetime import datetime
+
+
+@functools.lru_cache(maxsize=256)
+def isoformat_for_second(second: int) -> str:
+    """Format a whole number of seconds since the epoch as local ISO time."""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _with_microseconds(second: int, microsecond: int) -> str:
+    # The date/time part is formatted once per second; only the microseconds
+    # are filled in per call
+    if microsecond:
+        return f"{isoformat_for_second(second)}.{microsecond:06d}"
+    return isoformat_for_second(second)
+
+
+def format_time_ns(time_ns: int) -> str:
+    """Format a time.time_ns() value like datetime.now().isoformat()."""
+    second, ns = divmod(time_ns, 1_000_000_000)
+    return _with_microseconds(second, ns // 1000)
+
+
+def format_timestamp(timestamp: float) -> str:
+    """Format a time.time() value like datetime.fromtimestamp(timestamp).isoformat()."""
+    # Rounded to the microsecond the way datetime.fromtimestamp() rounds
+    fraction, second = math.modf(timestamp)
+    microsecond = round(fraction * 1e6)
+    if microsecond >= 1_000_000:
+        second += 1
+        microsecond -= 1_000_000
+    elif microsecond < 0:
+        second -= 1
+        microsecond += 1_000_000
+    return _with_microseconds(int(second), microsecond)
@@ -113,6 +113,9 @@ def test_logger():
     logger.log_crawl_start(category="SUV", subcategory="Premium")
     logger.log_crawl_complete({'saved': 10, 'failed': 2})
     
+    # Entries are written in the background; wait for them
+    logger.flush()
+    
     # Verify log file exists
     assert os.path.exists(logger.log_file), "Log file should exist"
     print(f"✅ Log file created: {logger.log_file}")
@@ -205,15 +208,11 @@ def test_checkpoint_integration():
         test_url = "https://www.netcarshow.com/test"
         checkpoint.mark_discovered(test_url)
         
-        # Manually add category/subcategory (as main.py does)
-        checkpoint_data = checkpoint.checkpoint_data.get(test_url, {})
-        checkpoint_data['category'] = 'SUV'
-        checkpoint_data['subcategory'] = 'Premium'
-        checkpoint.checkpoint_data[test_url] = checkpoint_data
-        checkpoint._save_checkpoint()
+        # Add category/subcategory (as main.py does)
+        checkpoint.set_context(test_url, 'SUV', 'Premium')
         
         # Verify it's stored
-        loaded_data = checkpoint.checkpoint_data.get(test_url, {})
+        loaded_data = checkpoint.get_record(test_url) or {}
         assert loaded_data.get('category') == 'SUV', "Category should be stored"
         assert loaded_data.get('subcategory') == 'Premium', "Subcategory should be stored"
         print("✅ Category/subcategory stored in checkpoint")
@@ -224,19 +223,581 @@ def test_checkpoint_integration():
         print(f"✅ Found {len(incomplete)} incomplete URLs")
         
         # Verify we can retrieve category/subcategory
-        if test_url in checkpoint.checkpoint_data:
-            cat = checkpoint.checkpoint_data[test_url].get('category', 'Unknown')
-            subcat = checkpoint.checkpoint_data[test_url].get('subcategory', 'Unknown')
+        record = checkpoint.get_record(test_url)
+        if record is not None:
+            cat = record.get('category', 'Unknown')
+            subcat = record.get('subcategory', 'Unknown')
             assert cat == 'SUV', "Should retrieve category"
             assert subcat == 'Premium', "Should retrieve subcategory"
             print(f"✅ Retrieved category/subcategory: {cat}/{subcat}")
         
+        # Verify state survives a reload from disk
+        checkpoint.close()
+        reloaded = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        assert reloaded.get_status(test_url) == 'discovered', "Status should survive reload"
+        assert (reloaded.get_record(test_url) or {}).get('category') == 'SUV', "Category should survive reload"
+        reloaded.close()
+        print("✅ Checkpoint state reloaded from disk")
+        
     finally:
         shutil.rmtree(test_checkpoint_dir)
     
     print("✅ Checkpoint integration test passed!\n")
 
 
+def test_checkpoint_legacy_migration():
+    """Test loading a checkpoint.json written by older versions."""
+    print("=" * 60)
+    print("Test 5: Legacy Checkpoint Migration")
+    print("=" * 60)
+    
+    test_checkpoint_dir = tempfile.mkdtemp()
+    
+    try:
+        from crawler.checkpoint import Checkpoint
+        
+        # Pretty-printed JSON dict of url -> record, as older versions wrote it
+        legacy_data = {
+            "https://www.netcarshow.com/bmw/2024-x5/": {
+                "status": "saved", "timestamp": "2024-05-01T10:00:00",
+                "category": "SUV", "subcategory": "Premium"
+            },
+            "https://www.netcarshow.com/audi/2024-q7/": {
+                "status": "failed", "timestamp": "2024-05-01T10:00:05",
+                "error": "Processing failed"
+            },
+            "https://www.netcarshow.com/volvo/2024-xc90/": {
+                "status": "discovered", "timestamp": "2024-05-01T10:00:09"
+            },
+        }
+        with open(os.path.join(test_checkpoint_dir, "checkpoint.json"), 'w') as f:
+            json.dump(legacy_data, f, indent=2)
+        with open(os.path.join(test_checkpoint_dir, "completed_urls.txt"), 'w') as f:
+            f.write("https://www.netcarshow.com/bmw/2024-x5/\n")
+        
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        for url, record in legacy_data.items():
+            assert checkpoint.get_record(url) == record, f"Legacy record should load unchanged: {url}"
+        assert checkpoint.is_completed("https://www.netcarshow.com/bmw/2024-x5/"), "Completed URL should load"
+        assert sorted(checkpoint.get_incomplete_urls()) == sorted(list(legacy_data)[1:]), \
+            "Failed and discovered URLs should be incomplete"
+        print("✅ Legacy checkpoint.json loaded")
+        
+        # Closing merges into the compressed snapshot and retires the legacy file
+        checkpoint.mark_parsed("https://www.netcarshow.com/volvo/2024-xc90/")
+        checkpoint.close()
+        assert os.path.exists(os.path.join(test_checkpoint_dir, "checkpoint.json.gz")), "Snapshot should be written"
+        assert not os.path.exists(os.path.join(test_checkpoint_dir, "checkpoint.json")), "Legacy file should be removed"
+        
+        reloaded = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        assert reloaded.get_record("https://www.netcarshow.com/audi/2024-q7/") == legacy_data[
+            "https://www.netcarshow.com/audi/2024-q7/"], "Migrated record should survive reload"
+        assert reloaded.get_status("https://www.netcarshow.com/volvo/2024-xc90/") == 'parsed', \
+            "Change made after migration should survive reload"
+        reloaded.close()
+        print("✅ Migrated to checkpoint.json.gz")
+        
+    finally:
+        shutil.rmtree(test_checkpoint_dir)
+    
+    print("✅ Legacy checkpoint migration test passed!\n")
+
+
+def test_checkpoint_crash_recovery():
+    """Test replaying the delta log over the base snapshot after a hard exit."""
+    print("=" * 60)
+    print("Test 6: Checkpoint Crash Recovery")
+    print("=" * 60)
+    
+    test_checkpoint_dir = tempfile.mkdtemp()
+    
+    try:
+        import subprocess
+        from crawler.checkpoint import Checkpoint
+        
+        # The child writes a base snapshot, logs more changes, then exits
+        # without close() or atexit handlers running
+        child = f"""
+import os, sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from crawler.checkpoint import Checkpoint
+checkpoint = Checkpoint(checkpoint_dir={test_checkpoint_dir!r})
+with checkpoint.batch():
+    for i in range(100):
+        checkpoint.mark_discovered(f"https://www.netcarshow.com/base/{{i}}")
+checkpoint.merge()
+with checkpoint.batch():
+    for i in range(50):
+        checkpoint.mark_failed(f"https://www.netcarshow.com/base/{{i}}", "timeout")
+    for i in range(20):
+        checkpoint.mark_discovered(f"https://www.netcarshow.com/logged/{{i}}")
+# Outside batch() writes are debounced: fewer than FLUSH_EVERY changes within
+# FLUSH_INTERVAL seconds of the last write stay in memory
+checkpoint.mark_saved("https://www.netcarshow.com/logged/0")
+for i in range(Checkpoint.FLUSH_EVERY - 2):
+    checkpoint.mark_discovered(f"https://www.netcarshow.com/pending/{{i}}")
+os._exit(0)
+"""
+        result = subprocess.run([sys.executable, "-c", child], capture_output=True, text=True)
+        assert result.returncode == 0, f"Child process failed: {result.stderr}"
+        assert os.path.exists(os.path.join(test_checkpoint_dir, "checkpoint.log")), "Delta log should exist"
+        
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        
+        # Base snapshot plus delta log: later log records override the base
+        for i in range(100):
+            expected = 'failed' if i < 50 else 'discovered'
+            assert checkpoint.get_status(f"https://www.netcarshow.com/base/{i}") == expected, \
+                "Delta log should be replayed over the base snapshot"
+        assert (checkpoint.get_record("https://www.netcarshow.com/base/0") or {}).get('error') == 'timeout', \
+            "Error should be replayed from the delta log"
+        for i in range(20):
+            assert checkpoint.get_status(f"https://www.netcarshow.com/logged/{i}") is not None, \
+                "URLs written inside batch() should survive a hard exit"
+        print("✅ Delta log replayed over base snapshot")
+        
+        # Accepted loss bound: changes made outside batch() since the last write
+        # (fewer than FLUSH_EVERY URLs, at most FLUSH_INTERVAL seconds old) are
+        # lost on a hard exit; flush()/close() write them
+        pending = [f"https://www.netcarshow.com/pending/{i}" for i in range(Checkpoint.FLUSH_EVERY - 2)]
+        lost = [url for url in pending if checkpoint.get_status(url) is None]
+        if checkpoint.get_status("https://www.netcarshow.com/logged/0") != 'saved':
+            lost.append("https://www.netcarshow.com/logged/0")
+        assert len(lost) <= Checkpoint.FLUSH_EVERY - 1, "At most FLUSH_EVERY - 1 unflushed changes may be lost"
+        print(f"✅ Lost {len(lost)} unflushed changes (bound: {Checkpoint.FLUSH_EVERY - 1} URLs / "
+              f"{Checkpoint.FLUSH_INTERVAL}s)")
+        
+        # Completed URLs are appended line by line, so a saved model is not
+        # crawled again even if its status change was lost
+        assert checkpoint.is_completed("https://www.netcarshow.com/logged/0"), \
+            "Completed URL should survive a hard exit"
+        print("✅ Completed URL survived hard exit")
+        checkpoint.close()
+        
+    finally:
+        shutil.rmtree(test_checkpoint_dir)
+    
+    print("✅ Checkpoint crash recovery test passed!\n")
+
+
+def test_checkpoint_merge():
+    """Test that merge() folds the delta log into the base snapshot."""
+    print("=" * 60)
+    print("Test 7: Checkpoint Merge")
+    print("=" * 60)
+    
+    test_checkpoint_dir = tempfile.mkdtemp()
+    
+    try:
+        from crawler.checkpoint import Checkpoint
+        
+        log_file = os.path.join(test_checkpoint_dir, "checkpoint.log")
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        with checkpoint.batch():
+            for i in range(10):
+                checkpoint.mark_discovered(f"https://www.netcarshow.com/m/{i}")
+            checkpoint.mark_saved("https://www.netcarshow.com/m/0")
+        with open(log_file, 'rb') as f:
+            assert len(f.read().splitlines()) == 10, "Batch should write one delta record per URL"
+        print("✅ Changes written to delta log")
+        
+        checkpoint.merge()
+        assert not os.path.exists(log_file), "Merge should truncate the delta log"
+        assert os.path.exists(os.path.join(test_checkpoint_dir, "checkpoint.json.gz")), "Merge should write the snapshot"
+        print("✅ Delta log merged and truncated")
+        
+        # Changes after the merge start a new log on top of the snapshot
+        checkpoint.mark_failed("https://www.netcarshow.com/m/1", "error")
+        checkpoint.flush()
+        with open(log_file, 'rb') as f:
+            assert len(f.read().splitlines()) == 1, "New log should hold only changes since the merge"
+        
+        reloaded = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        assert reloaded.get_status("https://www.netcarshow.com/m/0") == 'saved', "Merged record should reload"
+        assert reloaded.get_status("https://www.netcarshow.com/m/1") == 'failed', "Logged record should reload"
+        assert reloaded.get_statistics()['total'] == 10, "Every URL should reload once"
+        reloaded.close()
+        checkpoint.close()
+        print("✅ Snapshot and new log reloaded")
+        
+    finally:
+        shutil.rmtree(test_checkpoint_dir)
+    
+    print("✅ Checkpoint merge test passed!\n")
+
+
+class _StubSession:
+    """Stands in for requests.Session, replaying queued responses offline."""
+    
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+    
+    def queue(self, status_code, body=b'', headers=None):
+        import requests
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers.update(headers or {})
+        self.responses.append(response)
+    
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        response = self.responses.pop(0)
+        response.url = url
+        return response
+
+
+def test_fetcher_page_cache():
+    """Test the fetcher's page cache: fresh hits, 304 revalidation and replacement."""
+    print("=" * 60)
+    print("Test 8: Fetcher Page Cache")
+    print("=" * 60)
+    
+    test_checkpoint_dir = tempfile.mkdtemp()
+    
+    try:
+        from crawler.checkpoint import Checkpoint
+        from crawler.fetcher import Fetcher
+        
+        url = "https://www.netcarshow.com/bmw/2024-x5/"
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        fetcher = Fetcher(rate_limit=0, max_retries=1)
+        session = fetcher.session = _StubSession()
+        fetcher.http_cache = checkpoint
+        fetcher.cache_ttl = 3600
+        
+        # First fetch goes to the network and stores the body and validators
+        session.queue(200, b'<html>v1</html>', {'ETag': '"v1"'})
+        assert fetcher.fetch_url(url) == ('<html>v1</html>', 200, None), "First fetch should return the body"
+        assert checkpoint.get_conditional_headers(url) == {'If-None-Match': '"v1"'}, "ETag should be stored"
+        
+        # Fresh hit: served from the cache without a request
+        assert fetcher.fetch_url(url) == ('<html>v1</html>', 200, None), "Fresh page should be served from cache"
+        assert len(session.requests) == 1, "Fresh hit should not send a request"
+        print("✅ Fresh page served from cache without a request")
+        
+        # Stale copy is revalidated with a conditional GET; 304 returns the stored body
+        checkpoint.http_cache[url]['fetched_at'] -= 7200
+        session.queue(304)
+        assert fetcher.fetch_url(url) == ('<html>v1</html>', 304, None), "304 should return the cached body"
+        assert session.requests[-1][1].get('If-None-Match') == '"v1"', "Stale fetch should be conditional"
+        assert fetcher.fetch_url(url)[1] == 200 and len(session.requests) == 2, \
+            "304 should mark the cached copy fresh again"
+        print("✅ Stale page revalidated with 304")
+        
+        # A 200 on revalidation replaces the stored body and validators
+        checkpoint.http_cache[url]['fetched_at'] -= 7200
+        session.queue(200, b'<html>v2</html>', {'ETag': '"v2"'})
+        assert fetcher.fetch_url(url) == ('<html>v2</html>', 200, None), "200 should return the new body"
+        assert checkpoint.load_cached_body(url) == '<html>v2</html>', "New body should replace the stored one"
+        assert checkpoint.get_conditional_headers(url) == {'If-None-Match': '"v2"'}, "New ETag should be stored"
+        print("✅ 200 replaced the stored body")
+        
+        # 304 for a body that was deleted or is unreadable drops the entry and
+        # refetches the page without validators
+        for version, damage in (("v3", None), ("v4", b'not gzip data')):
+            checkpoint.http_cache[url]['fetched_at'] -= 7200
+            os.remove(checkpoint._body_path(url))
+            if damage:
+                with open(checkpoint._body_path(url), 'wb') as f:
+                    f.write(damage)
+            session.queue(304)
+            session.queue(200, f'<html>{version}</html>'.encode(), {'ETag': f'"{version}"'})
+            requests_before = len(session.requests)
+            assert fetcher.fetch_url(url) == (f'<html>{version}</html>', 200, None), \
+                "304 without a usable cached body should be refetched"
+            assert len(session.requests) == requests_before + 2, "Refetch should be a second request"
+            assert 'If-None-Match' in session.requests[-2][1], "First request should be conditional"
+            assert 'If-None-Match' not in session.requests[-1][1], "Refetch should be unconditional"
+            assert checkpoint.load_cached_body(url) == f'<html>{version}</html>', "Refetched body should be stored"
+        print("✅ Missing or unreadable cached body refetched with 200")
+        
+        checkpoint.close()
+        
+    finally:
+        shutil.rmtree(test_checkpoint_dir)
+    
+    print("✅ Fetcher page cache test passed!\n")
+
+
+def test_http_cache_compaction():
+    """Test that the HTTP cache log keeps only the latest entry per URL."""
+    print("=" * 60)
+    print("Test 9: HTTP Cache Log Compaction")
+    print("=" * 60)
+    
+    test_checkpoint_dir = tempfile.mkdtemp()
+    
+    try:
+        from crawler.checkpoint import Checkpoint
+        
+        def log_lines():
+            with open(checkpoint.http_cache_file, 'rb') as f:
+                return sum(1 for _ in f)
+        
+        urls = [f"https://www.netcarshow.com/bmw/2024-x{i}/" for i in range(5)]
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        checkpoint.HTTP_CACHE_COMPACT_EVERY = 10
+        
+        # Refetching the same pages supersedes their earlier lines; the log is
+        # rewritten once HTTP_CACHE_COMPACT_EVERY lines are stale
+        for round_number in range(3):
+            for url in urls:
+                checkpoint.store_response(url, f'"{round_number}"', None, f'<html>{round_number}</html>')
+        assert log_lines() == 5, f"Log should have been compacted, found {log_lines()} lines"
+        print("✅ Log compacted after superseded entries piled up")
+        
+        # Close compacts whatever is stale, including dropped URLs
+        checkpoint.refresh_response(urls[0])
+        checkpoint.drop_response(urls[1])
+        assert log_lines() == 7, "Entries should be appended between compactions"
+        checkpoint.close()
+        assert log_lines() == 4, "Close should leave one line per cached URL"
+        print("✅ Log compacted on close")
+        
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        assert sorted(checkpoint.http_cache) == sorted(urls[:1] + urls[2:]), "Compacted log should reload"
+        assert checkpoint.get_conditional_headers(urls[2]) == {'If-None-Match': '"2"'}, \
+            "Latest validators should survive compaction"
+        checkpoint.close()
+        
+    finally:
+        shutil.rmtree(test_checkpoint_dir)
+    
+    print("✅ HTTP cache compaction test passed!\n")
+
+
+def test_checkpoint_saved_after_crash():
+    """Test that saved statuses and completed URLs agree after a hard exit."""
+    print("=" * 60)
+    print("Test 10: Saved Status After Crash")
+    print("=" * 60)
+    
+    test_checkpoint_dir = tempfile.mkdtemp()
+    
+    try:
+        import subprocess
+        from crawler.checkpoint import Checkpoint
+        
+        # Like the crawler, the child saves models inside batch(), whose delta
+        # log write is deferred to the end of the batch, and dies before then
+        child = f"""
+import os, sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from crawler.checkpoint import Checkpoint
+checkpoint = Checkpoint(checkpoint_dir={test_checkpoint_dir!r})
+with checkpoint.batch():
+    for i in range(10):
+        checkpoint.mark_discovered(f"https://www.netcarshow.com/model/{{i}}")
+with checkpoint.batch():
+    for i in range(5):
+        checkpoint.mark_parsed(f"https://www.netcarshow.com/model/{{i}}")
+        checkpoint.mark_saved(f"https://www.netcarshow.com/model/{{i}}")
+    os._exit(0)
+"""
+        result = subprocess.run([sys.executable, "-c", child], capture_output=True, text=True)
+        assert result.returncode == 0, f"Child process failed: {result.stderr}"
+        
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        saved = [f"https://www.netcarshow.com/model/{i}" for i in range(5)]
+        for url in saved:
+            assert checkpoint.is_completed(url), "Completed URL should survive a hard exit"
+            assert checkpoint.get_status(url) == 'saved', "Completed URL should be reported as saved"
+        incomplete = set(checkpoint.get_incomplete_urls())
+        assert not incomplete & set(saved), "Completed URLs should not be reported as incomplete"
+        assert checkpoint.get_statistics()['saved'] == len(checkpoint.completed_urls) == 5, \
+            "Saved count should match completed URLs"
+        print("✅ Saved statuses reconciled from completed URLs")
+        
+        # The reconciled statuses are written back, so they hold on the next load too
+        checkpoint.close()
+        checkpoint = Checkpoint(checkpoint_dir=test_checkpoint_dir)
+        assert checkpoint.get_statistics()['saved'] == 5, "Reconciled statuses should be persisted"
+        checkpoint.close()
+        print("✅ Reconciled statuses persisted")
+        
+    finally:
+        shutil.rmtree(test_checkpoint_dir)
+    
+    print("✅ Saved status crash test passed!\n")
+
+
+def _offline_site(models):
+    """Pages of a small offline NetCarShow with one listing linking the given (make, year, model) pages."""
+    base = "https://www.netcarshow.com"
+    listing = ''.join(f'<a href="/{make}/{year}-{model}/">{model}</a>' for make, year, model in models)
+    pages = {
+        f"{base}/": '<html><body><a href="/explore/crossover-suv/">Crossover SUV</a></body></html>',
+        f"{base}/explore/crossover-suv": '<html><body><a href="/explore/crossover-suv/premium/">Premium</a></body></html>',
+        f"{base}/explore/crossover-suv/premium/": f'<html><body>{listing}</body></html>',
+    }
+    for make, year, model in models:
+        pages[f"{base}/{make}/{year}-{model}/"] = f"""<html><head><title>{make} {model} ({year})</title>
+<meta name="description" content="The {year} {make} {model} is a great SUV with a lot of features."></head>
+<body><h1>{make} {model} ({year})</h1><div class="review"><p>The {year} {make} {model} has a 300-horsepower,
+3.0-liter, inline six engine mated to an 8-speed automatic. It offers heated front seats and all-wheel drive.</p>
+<ul><li>Engine: 3.0L turbo</li><li>Seats: leather</li></ul></div>
+<img src="/R/{make}-{model}-{year}-1280-01.jpg"></body></html>"""
+    return pages
+
+
+def test_concurrent_model_crawl():
+    """Test crawling a category with several model pages processed at once."""
+    print("=" * 60)
+    print("Test 11: Concurrent Model Crawl")
+    print("=" * 60)
+    
+    import threading
+    import time
+    
+    test_data_dir = tempfile.mkdtemp()
+    test_checkpoint_dir = tempfile.mkdtemp()
+    test_log_dir = tempfile.mkdtemp()
+    
+    try:
+        models = [(make, "2024", f"m{i}") for i, make in enumerate(["bmw", "audi", "volvo", "lexus"] * 3)]
+        pages = _offline_site(models)
+        # One listed model has no page; it must fail without affecting the others
+        missing = "https://www.netcarshow.com/lexus/2024-m11/"
+        del pages[missing]
+        
+        crawler = Crawler(
+            output_dir=test_data_dir,
+            checkpoint_dir=test_checkpoint_dir,
+            log_dir=test_log_dir,
+            rate_limit=0,
+            concurrency=4,
+            parse_workers=1
+        )
+        
+        # Offline fetcher: serves the pages above and records how many
+        # requests overlap
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, most seen
+        
+        def fake_fetch_url(url, timeout=60, headers=None, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            html = pages.get(url)
+            return (html, 200, None) if html else (None, 404, "Client error 404")
+        
+        crawler.fetcher.fetch_url = fake_fetch_url
+        stats = crawler.crawl_category("SUV", "Premium")
+        
+        assert in_flight[1] > 1, "Model pages should be fetched concurrently"
+        print(f"✅ Up to {in_flight[1]} requests in flight")
+        
+        assert stats['discovered'] == len(models), f"Should discover {len(models)} models, got {stats}"
+        assert stats['saved'] == len(models) - 1 and stats['failed'] == 1, f"Unexpected stats: {stats}"
+        saved_files = [f for _, _, files in os.walk(test_data_dir) for f in files if f.endswith('.json')]
+        assert len(saved_files) == len(models) - 1, f"Expected {len(models) - 1} files, found {len(saved_files)}"
+        print(f"✅ Results collected from all workers: {stats['saved']} saved, {stats['failed']} failed")
+        
+        for make, year, model in models:
+            url = f"https://www.netcarshow.com/{make}/{year}-{model}/"
+            expected = 'failed' if url == missing else 'saved'
+            assert crawler.checkpoint.get_status(url) == expected, f"{url} should be {expected}"
+            assert crawler.checkpoint.is_completed(url) == (expected == 'saved'), "Completed URLs should match"
+        print("✅ Checkpoint status recorded per model")
+        
+        crawler.checkpoint.close()
+        
+    finally:
+        shutil.rmtree(test_data_dir)
+        shutil.rmtree(test_checkpoint_dir)
+        shutil.rmtree(test_log_dir)
+    
+    print("✅ Concurrent model crawl test passed!\n")
+
+
+def test_parse_pool():
+    """Test that worker and inline parsing agree, including after a worker dies."""
+    print("=" * 60)
+    print("Test 12: Parse Pool")
+    print("=" * 60)
+    
+    import signal
+    import subprocess
+    import time
+    from concurrent.futures.process import BrokenProcessPool
+    from crawler.parse_pool import ParsePool, parse_listing_html, parse_model_html
+    
+    models = [("bmw", "2024", "x5"), ("audi", "2023", "q7")]
+    pages = _offline_site(models)
+    jobs = [(parse_listing_html, pages["https://www.netcarshow.com/explore/crossover-suv/premium/"], "SUV", "Premium")]
+    jobs += [(parse_model_html, pages[f"https://www.netcarshow.com/{make}/{year}-{model}/"],
+              f"https://www.netcarshow.com/{make}/{year}-{model}/") for make, year, model in models]
+    
+    # 0 and 1 parse inline, 2 in worker processes; the results must not differ
+    results = {}
+    for workers in (0, 1, 2):
+        pool = ParsePool(max_workers=workers)
+        results[workers] = [pool.submit(*job).result() for job in jobs]
+        pool.close()
+    assert results[0] == results[1] == results[2], "Parse results should not depend on the worker count"
+    assert results[0][1][0].get('make') and results[0][1][1], "Model page should parse with trims"
+    print("✅ Inline and worker parsing agree")
+    
+    # When a worker dies, the pool is dropped and parsing continues inline
+    pool = ParsePool(max_workers=2)
+    pool.submit(*jobs[0]).result()
+    for pid in list(pool._executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    for _ in range(50):
+        try:
+            result = pool.submit(*jobs[1]).result()
+        except BrokenProcessPool:
+            continue
+        if pool.max_workers == 1:
+            break
+    assert pool.max_workers == 1 and pool._executor is None, "Broken pool should fall back to inline parsing"
+    assert result == results[0][1], "Fallback parsing should give the same result"
+    print("✅ Broken worker pool falls back to inline parsing")
+    
+    # crawl.py turns SIGTERM into a normal exit, so the pool's atexit handler
+    # shuts the workers down instead of leaving them behind
+    test_dir = tempfile.mkdtemp()
+    try:
+        script = os.path.join(test_dir, "sigterm_child.py")
+        with open(script, "w") as f:
+            f.write(f"""
+import os, signal, sys, time
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from crawler.parse_pool import ParsePool, parse_listing_html
+
+if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(143))
+    pool = ParsePool(max_workers=2)
+    pool.submit(parse_listing_html, "<a href='/bmw/2024-x5/'>X5</a>").result()
+    print(" ".join(str(pid) for pid in pool._executor._processes), flush=True)
+    os.kill(os.getpid(), signal.SIGTERM)
+    time.sleep(30)
+""")
+        result = subprocess.run([sys.executable, script], capture_output=True, text=True, timeout=60)
+        assert result.returncode == 143, f"Child should exit on SIGTERM: {result.stderr}"
+        worker_pids = [int(pid) for pid in result.stdout.split()]
+        assert worker_pids, "Child should have started workers"
+        for pid in worker_pids:
+            for _ in range(50):
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    break
+                time.sleep(0.1)
+            else:
+                raise AssertionError(f"Worker {pid} outlived the crawler after SIGTERM")
+        print("✅ Workers shut down on SIGTERM")
+    finally:
+        shutil.rmtree(test_dir)
+    
+    print("✅ Parse pool test passed!\n")
+
+
 def main():
     """Run all Day 3 tests."""
     print("\n" + "=" * 60)
@@ -257,6 +818,24 @@ def main():
         # Test 4: Checkpoint integration
         test_checkpoint_integration()
         
+        # Tests 5-7: Checkpoint migration, crash recovery and merge
+        test_checkpoint_legacy_migration()
+        test_checkpoint_crash_recovery()
+        test_checkpoint_merge()
+        
+        # Test 8: Fetcher page cache
+        test_fetcher_page_cache()
+        
+        # Test 9: HTTP cache log compaction
+        test_http_cache_compaction()
+        
+        # Test 10: Saved status after a crash
+        test_checkpoint_saved_after_crash()
+        
+        # Tests 11-12: Concurrent model crawl and parse pool
+        test_concurrent_model_crawl()
+        test_parse_pool()
+        
         # Summary
         print("=" * 60)
         print("All Day 3 Tests Passed! ✅")